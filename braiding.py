@@ -20,6 +20,7 @@
 # Maintenance History:
 #     29 Jul 2020 - EC - Initial version (sparsify)
 #     30 Jul 2020 - EC - Directionally biased braiding
+#     16 Oct 2026 - EC - Remove cells through Grid.__delitem__
 ##############################################################################
 """
 braiding.py - basic braiding implementation
@@ -106,7 +107,7 @@ class Braiding:
             # step 3: remove the cells from the grid
         for cell in clipped:
             index = cell.index
-            del grid.cells[index]               # remove cell from grid
+            del grid[index]                     # remove cell from grid
 
     @staticmethod
     def opposites():
@@ -21,6 +21,10 @@
 #     15 May 2020 - Added topology management routines
 #         These will provide hooks for masking routines...
 #         Also, they avoid direct access of the cell topology dictionary...
+#     16 Oct 2026 - Added static_neighborhood class attribute
+#       Traverse the neighborhood without reindexing the topology
+#       Declare __slots__
+#       Build the neighbor list without a generator
 """
 cell.py - basic cell implementation
 Copyright ©2020 by Eric Conrad
@@ -80,6 +84,16 @@ class Cell(object):
 
     ID = -1                 # source for a unique identifier for the cell
 
+        # Subclasses which do not declare __slots__ get an instance
+        # dictionary as usual.
+    __slots__ = ("id", "index", "name", "kwargs", "topology", "arcs")
+
+        # If the neighborhood of a cell can change while a maze is being
+        # carved (for example, a weave cell which can tunnel under one of
+        # its neighbors), the subclass should set this to False.  Carving
+        # algorithms may cache the neighborhoods of the other cells.
+    static_neighborhood = True
+
     def __init__(self, index, **kwargs):
         """constructor
 
@@ -129,8 +143,7 @@ class Cell(object):
 
     def each_neighbor(self):
         """traverse the neighborhood"""
-        for direction in self.topology:
-            nbr = self.topology[direction]
+        for nbr in self.topology.values():
             if nbr:
                 yield nbr
 
@@ -182,12 +195,8 @@ class Cell(object):
 
     def neighbors(self):
         """return a list of neighboring cells"""
-            # use the topology management routines
-        # return list(self.topology.values())
-        L = []
-        for nbr in self.each_neighbor():
-            L.append(nbr)
-        return L
+            # same cells as each_neighbor, without the generator
+        return [nbr for nbr in self.topology.values() if nbr]
 
     def have_passage(self, cell):
         """determine whether a given cell is connected by a passage"""
@@ -20,6 +20,9 @@
 ##############################################################################
 # Maintenance History:
 #     23 Apr 2020 - EC - Initial version
+#     16 Oct 2026 - EC - Gather the statistics in one pass
+#       Format the degree sequence with str.join
+#       Compare counts with == rather than is
 # Credits:
 #     EC - Eric Conrad
 ##############################################################################
@@ -42,14 +45,7 @@ from helpers import Helper
 
 def sorted_degrees(d):
     """format the degree sequence"""
-    s = ""
-    X = sorted(list(d))
-    if not X:
-        return s
-    for x in X:
-        s += "%d -> %d, " % (x, d[x])
-    s = s[:-2]
-    return s
+    return ", ".join("%d -> %d" % (x, d[x]) for x in sorted(d))
 
 def init(name, complete):
     """Label west and east ends for gluing"""
@@ -65,14 +61,12 @@ def tests(grid):
     print(grid.unicode())
 
     stats = Maze_Statistics(grid)
-    v = stats.size()
-    p, w, e = stats.Euler_edge_counts()
+    v, (p, w, e), degseq = stats.summary()
     
     k, _ = Helper.find_components(grid)
     print("%s: %d cells" % (stats.name, v) + \
         ", %d passages, %d walls, %d edges" % (p//2, w//2, e//2) + \
         ", %d maze components" % k)
-    degseq = stats.degree_counts()
     print("  Degree sequence: " + sorted_degrees(degseq))
     
         # The maze is a tree if and only if both of the following
@@ -81,11 +75,11 @@ def tests(grid):
         #   (b) the number of passages is one less than the number
         #       of cells.
 
-    assert v is 35, "Vertex count error (got %s, expected v=5x7=35)" % v
-    assert p is 68, "Passage count error (got %s, expected p=v-1=34)" % (p//2)
-    assert e is 126, "Edge count error (got %s, expected e=63)" % (e//2)
-    assert w is 58, "Wall count error (got %s, expected w=e-p=29)" % (w//2)
-    assert k is 1, "The maze is disconnected (got k=%d, expected k=1)" % k
+    assert v == 35, "Vertex count error (got %s, expected v=5x7=35)" % v
+    assert p == 68, "Passage count error (got %s, expected p=v-1=34)" % (p//2)
+    assert e == 126, "Edge count error (got %s, expected e=63)" % (e//2)
+    assert w == 58, "Wall count error (got %s, expected w=e-p=29)" % (w//2)
+    assert k == 1, "The maze is disconnected (got k=%d, expected k=1)" % k
 
     # BINARY TREE ALGORITHM (adapted)
 
@@ -21,6 +21,10 @@
 #     21 Apr 2020 - EC - Initial version
 #     23 Apr 2020 - EC - Add return value to __setitem__
 #     26 Jul 2020 - EC - Add dead_ends and braid methods
+#     16 Oct 2026 - EC - Add __delitem__
+#       Look up cells with a single dictionary probe
+#       Add clear_passages method
+#       Iterate over the cells without reindexing
 # Credits:
 #     EC - Eric Conrad
 ##############################################################################
@@ -94,15 +98,17 @@ class Grid(object):
 
     def __getitem__(self, index):
         """return the cell associated with the given index"""
-        if index in self.cells:
-            return self.cells[index]      # return the cell
-        return None                   # no such cell
+        return self.cells.get(index)      # None if there is no such cell
 
     def __setitem__(self, index, cell):
         """"associate the cell with the given index"""
         self.cells[index] = cell
         return cell
 
+    def __delitem__(self, index):
+        """remove the cell with the given index"""
+        del self.cells[index]
+
     def choice(self):
         """return a cell at random"""
         from random import choice
@@ -117,8 +123,14 @@ class Grid(object):
 
     def each(self):
         """iterate over the cells"""
-        for index in self.cells:
-            yield self.cells[index]
+        yield from self.cells.values()
+
+        # passages
+
+    def clear_passages(self):
+        """remove every passage (e.g. to carve a new maze on the grid)"""
+        for cell in self.cells.values():
+            cell.arcs.clear()
 
         # braiding
 
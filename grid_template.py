@@ -19,6 +19,7 @@
 ##############################################################################
 # Maintenance History:
 #     1 Aug 2020 - EC - Initial version
+#     16 Oct 2026 - EC - Remove cells through Grid.__delitem__
 ##############################################################################
 """
 grid_template.py - grid template implementation
@@ -109,7 +110,7 @@ class Grid_Template(object):
         for direction in directions:
             self.remove_grid_edge(cell, direction, logging=False)
 
-        del self.grid.cells[cell.index]
+        del self.grid[cell.index]
 
         if logging:
                 # this maintains a reference to the "deleted" cell
@@ -21,6 +21,9 @@
 #     27 Jul 2020 - Add draw_inset_cell method
 #     29 Jul 2020 - For undercells, assume inset and only draw passages
 #     6 Aug 2020 - In render, change pad_inched to pad_inches
+#     16 Oct 2026 - Optionally batch walls and patches into collections
+#       Give batched walls the same line caps as plotted walls
+#       Batched patches with transparent edges have no edges
 """
 layout_plot.py - basic plotter implementation for rectangular mazes
 Copyright ©2020 by Eric Conrad
@@ -40,10 +43,22 @@ class Layout(object):
     """implementation of rectangular maze layout using matplotlib"""
     
     def __init__(self, grid, plt, **kwargs):
-        """constructor"""
+        """constructor
+
+        Optional named arguments:
+            figure - a (Figure, Axes) pair (default: a new subplot)
+            title - a title for the subplot
+            batch - if True, walls and patches are collected and added
+                to the plot as collections when the grid is drawn
+                (default: False).  For large grids, this is much
+                faster than adding one artist per wall.
+        """
         self.grid = grid
         self.plt = plt
         self.kwargs = kwargs
+        self.batch = kwargs["batch"] if "batch" in kwargs else False
+        self.segments = {}            # batched walls by color
+        self.patches = []             # batched patches
 
         self.fig, self.ax = kwargs["figure"] if "figure" in kwargs \
             else plt.subplots(1, 1)
@@ -123,17 +138,54 @@ class Layout(object):
 
     def draw_polyline(self, X, Y, linecolor):
         """draw a wall"""
+        if self.batch:
+            if linecolor not in self.segments:
+                self.segments[linecolor] = []
+            self.segments[linecolor].append(list(zip(X, Y)))
+            return
         self.ax.plot(X, Y, color=linecolor)
 
+    def add_patch(self, patch):
+        """add a patch (e.g. a colored rectangle) to the plot"""
+        if self.batch:
+            self.patches.append(patch)
+            return
+        self.ax.add_patch(patch)
+
+    def flush(self):
+        """add any batched patches and walls to the plot"""
+        if not (self.patches or self.segments):
+            return
+        from matplotlib import rcParams
+        from matplotlib.collections import LineCollection, PatchCollection
+
+        if self.patches:
+                # a patch drawn on its own has no edge when its edge color
+                # is transparent, so neither should its batched copy
+                # (otherwise seams open up between adjacent patches)
+            collection = PatchCollection(self.patches, match_original=True)
+            collection.set_linewidths([0 if patch.get_edgecolor()[3] == 0 \
+                else patch.get_linewidth() for patch in self.patches])
+            self.ax.add_collection(collection)
+        for linecolor in self.segments:
+            self.ax.add_collection(LineCollection(self.segments[linecolor], \
+                colors=linecolor, capstyle=rcParams["lines.solid_capstyle"],
+                joinstyle=rcParams["lines.solid_joinstyle"]))
+        self.patches = []
+        self.segments = {}
+        self.ax.autoscale_view()
+
     def draw_grid(self, linecolor="black"):
         for cell in self.grid.each():
             if cell.inset > 0:
                 self.draw_inset_cell(cell, linecolor, cell.inset)
             else:
                 self.draw_cell(cell, linecolor)
+        self.flush()
 
     def render(self, filename, tight=False):
         """render the output"""
+        self.flush()
         if tight:
             self.fig.savefig(filename, bbox_inches='tight', pad_inches=0.0)
         else:
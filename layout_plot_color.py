@@ -23,6 +23,9 @@
 #       Note to self: For undercells, only the passage are colored as the
 #         body of the cell is hidden from view.  This will be important in
 #         weave mazes.
+#     16 Oct 2026 - Add patches through Layout.add_patch (for batching)
+#       Add set_colors method
+#       Add set_palette method
 """
 layout_plot_color.py - basic plotting with color for rectangular mazes
 Copyright ©2020 by Eric Conrad
@@ -60,7 +63,7 @@ class Color_Layout(Layout):
             rect = patches.Rectangle((x0,y0), cell.scale, cell.scale,
                                      edgecolor=None,
                                      facecolor=facecolor)
-            self.ax.add_patch(rect)
+            self.add_patch(rect)
         super().draw_cell(cell, color)
 
     def draw_inset_cell(self, cell, color, inset):
@@ -90,31 +93,31 @@ class Color_Layout(Layout):
             x0, y0 = x-half+inset, y-half+inset         # SW corner
             rect = patches.Rectangle((x0, y0), scale, scale, \
                 edgecolor=None, facecolor=facecolor)
-            self.ax.add_patch(rect)
+            self.add_patch(rect)
 
         if cell.status("south"):            # south passage
             x0, y0 = x-half+inset, y-half
             rect = patches.Rectangle((x0,y0), scale, inset, \
                 edgecolor=None, facecolor=facecolor)
-            self.ax.add_patch(rect)
+            self.add_patch(rect)
 
         if cell.status("east"):             # east passage
             x0, y0 = x+half-inset, y-half+inset 
             rect = patches.Rectangle((x0,y0), inset, scale, \
                 edgecolor=None, facecolor=facecolor)
-            self.ax.add_patch(rect)
+            self.add_patch(rect)
 
         if cell.status("north"):            # north passage
             x0, y0 = x-half+inset, y+half-inset 
             rect = patches.Rectangle((x0,y0), scale, inset, \
                 edgecolor=None, facecolor=facecolor)
-            self.ax.add_patch(rect)
+            self.add_patch(rect)
 
         if cell.status("west"):             # west passage
             x0, y0 = x-half, y-half+inset 
             rect = patches.Rectangle((x0,y0), inset, scale, \
                 edgecolor=None, facecolor=facecolor)
-            self.ax.add_patch(rect)
+            self.add_patch(rect)
 
             # now fill in the walls and passages
         super().draw_inset_cell(cell, color, inset)
@@ -123,8 +126,24 @@ class Color_Layout(Layout):
         """load the color into the palette"""
         self.palette[ID] = color
 
+    def set_palette(self, colors):
+        """load several colors into the palette
+
+        Argument:
+            colors - a dictionary mapping palette IDs to colors
+        """
+        self.palette.update(colors)
+
     def set_color(self, cell, ID):
         """set the color of a cell"""
         self.color[cell] = ID
 
+    def set_colors(self, colors):
+        """set the colors of several cells
+
+        Argument:
+            colors - a dictionary mapping cells to palette IDs
+        """
+        self.color.update(colors)
+
 # END: layout_plot_color.py
@@ -18,6 +18,7 @@
 #
 # Maintenance History:
 #     15 Aug 2020 - Initial version
+#     16 Oct 2026 - Flush batched stairwell markings
 """
 layout_plot_multilevel.py - basic plotting with color for rectangular mazes
 Copyright ©2020 by Eric Conrad
@@ -164,6 +165,7 @@ class Multilevel_Layout(Layout):
                 # here we are assuming the number of stairwells is small
             for staircell in self.grid.stairs:
                 layout.draw_stairwell(staircell, linecolor)
+            layout.flush()
         if self.kwargs["schematic"]:
             self.draw_schematic(linecolor, deadcolor)
 
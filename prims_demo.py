@@ -23,6 +23,12 @@
 #     29 Aug 2020 - (1) Incorporate command line parsing with argparse
 #       (2) Correct documentation
 #       (3) Add a simple multilevel maze test script
+#     16 Oct 2026 - Batch the plots; use the Agg backend unless showing
+#       Compare integers with == in build_corner_stairwells
+#       Precompute the stairwell corners
+#       Set the cell colors in bulk
+#       Color the undercells of a weave maze using Weave_Grid.under_cells
+#       Choose random stairwells from a list of free cells (no retries)
 ##############################################################################
 """
 prims_demo.py - demonstrate Prim's algorithm
@@ -39,6 +45,7 @@ References:
     [1] Jamis Buck.  Mazes for Programmers.  2015 (Pragmatic Bookshelf).
         Book (978-1-68050-055-4).
 """
+from random import randrange
 import matplotlib.pyplot as plt
 from prims import Prims
 from layout_plot_color import Color_Layout
@@ -108,11 +115,16 @@ def render(maze, filename, tweaker=tweak, title="Prim's Algorithm"):
 
         # generate the plots
     print("Plotting maze...")
-    layout = Color_Layout(maze, plt, figure=[fig, ax])
+    layout = Color_Layout(maze, plt, figure=[fig, ax], batch=True)
     layout.palette[0] = "yellow"
     layout.palette[1] = "brown"
-    for cell in maze.each():
-        layout.color[cell] = 1 if "underCell" in cell.kwargs else 0
+    colors = dict.fromkeys(maze.each(), 0)
+    if hasattr(maze, "under_cells"):            # weave maze
+        colors.update(dict.fromkeys(maze.under_cells, 1))
+    else:
+        colors.update({cell: 1 for cell in colors \
+            if "underCell" in cell.kwargs})
+    layout.set_colors(colors)
     layout.draw_grid()
     print("Saved to " + filename)
     layout.render(filename)
@@ -138,7 +150,8 @@ def render_multilevel(maze, filename, tweaker=tweak):
         # generate the plots
     print("Plotting maze...")
     ax = axs[levels]
-    layout = Multilevel_Projective_Layout(maze, plt, figure=(fig, ax))
+    layout = Multilevel_Projective_Layout(maze, plt, figure=(fig, ax), \
+        batch=True)
     ax.title.set_text("schematic")
     ax.axis("off")
 
@@ -147,12 +160,11 @@ def render_multilevel(maze, filename, tweaker=tweak):
         ax = axs[level]
         tweaker(fig, ax, subgrid.name)
         sublayout = layout.add_layout_for_grid(subgrid, plt, \
-            Color_Layout, figure=(fig, ax))
+            Color_Layout, figure=(fig, ax), batch=True)
         sublayout.palette[0] = "yellow"
         sublayout.palette[1] = "brown"
-        for cell in maze.each():
-            sublayout.color[cell] = 1 if "underCell" in cell.kwargs \
-                else 0
+        sublayout.set_colors({cell: 1 if "underCell" in cell.kwargs \
+            else 0 for cell in maze.each()})
 
     layout.draw_grid()
     print("Saved to " + filename)
@@ -162,26 +174,42 @@ def render_multilevel(maze, filename, tweaker=tweak):
 def build_corner_stairwells(grid):
     """build stairwells in alternating corners"""
     print("Building stairwells in alternating corners...")
-    levels = len(grid.levels)
-    for level in range(levels-1):
-        subgrid = grid.levels[level]
+        # the two pairs of opposite corners on each level but the top
+    corners = []
+    for subgrid in grid.levels[:-1]:
         m, n = subgrid.rows, subgrid.cols
-        downcells = [subgrid[0, 0], subgrid[m-1, n-1]] if level%2 is 0 \
-            else [subgrid[0, n-1], subgrid[m-1, 0]]
+        corners.append(((subgrid[0, 0], subgrid[m-1, n-1]), \
+            (subgrid[0, n-1], subgrid[m-1, 0])))
+
+    for level in range(len(corners)):
+        downcells = corners[level][level % 2]
         grid.add_stairs_upward(level, downcells[0])
         grid.add_stairs_upward(level, downcells[1])
 
-def build_random_stairwell(grid, level):
-    """attempt to build a stairwell at a random location"""
-    retries = 10
-    subgrid = grid.levels[level]
-    for i in range(retries):
-        downcell = subgrid.choice()
-        if downcell["down"] or downcell["up"]:
-            continue      # hash collision
-        grid.add_stairs_upward(level, downcell)
-        return 1          # success
-    return 0              # failure
+def free_stair_cells(grid, level):
+    """list the cells on a level which are not part of a stairwell"""
+    return [cell for cell in grid.levels[level].each() \
+        if not (cell["down"] or cell["up"])]
+
+def build_random_stairwell(grid, level, free=None):
+    """attempt to build a stairwell at a random location
+
+    Arguments:
+        grid - the multilevel grid
+        level - the level of the lower end of the stairwell
+        free - (optional) the list returned by free_stair_cells.  The
+            chosen cell is removed from the list.
+    """
+    if free is None:
+        free = free_stair_cells(grid, level)
+    if not free:
+        return 0          # failure
+    k = randrange(len(free))
+    downcell = free[k]
+    free[k] = free[-1]    # remove the chosen cell
+    free.pop()
+    grid.add_stairs_upward(level, downcell)
+    return 1              # success
 
 def build_stairwells(grid, n):
     """build n stairwells per level"""
@@ -189,8 +217,9 @@ def build_stairwells(grid, n):
     levels = len(grid.levels)
     for level in range(levels-1):
         built = 0
+        free = free_stair_cells(grid, level)
         for i in range(n):
-            built += build_random_stairwell(grid, level)
+            built += build_random_stairwell(grid, level, free)
         if built < n:
             print(" -- level %d: wanted %d stairwells up, got %d" \
                 % (level, n, built))
@@ -266,6 +295,10 @@ if __name__ == "__main__":
     if not args.dim:
         args.dim = [20, 10] if args.multilevel else [30, 40]
 
+        # we only need an interactive backend to show the figure
+    if not args.show:
+        plt.switch_backend("agg")
+
         # generate the requested maze
     if args.multilevel:
         main_multilevel(args)
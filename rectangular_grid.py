@@ -20,6 +20,12 @@
 #     21 Apr 2020 - Initial version
 #     30 Apr 2020 - Reconfigure name parameter as "C[i,j]"
 #     15 May 2020 - Use cell topology management methods.
+#     16 Oct 2026 - Build ASCII and Unicode displays with str.join
+#       Check the wallAdder option once per grid in configure
+#       Cache the row major and column major traversals
+#       Gather the wall statuses a row at a time for display
+#       Hoist the display glyphs into module constants
+#       Compute the cell x-coordinates once per grid
 """
 rectangular_grid.py - rectangular grid and maze implementation
 Copyright ©2020 by Eric Conrad
@@ -45,6 +51,19 @@ Bugs:
 from square_cell import Square_Cell
 from grid import Grid
 
+    # ASCII display pieces
+_WALL_N, _OPEN_N = "+---", "+   "           # a corner and a north side
+_WALL_W, _OPEN_W = "| ", "  "               # a west side
+
+    # Unicode box drawing pieces
+_TL, _TR, _BL, _BR = "\u250f", "\u2513", "\u2517", "\u251b"    # corners
+_T, _B, _L, _R = "\u2533", "\u253b", "\u2523", "\u252b"        # tees
+_X = "\u254b"                                # crossing
+_V = "\u2503"                                # vertical wall
+_V1 = _V + " "                               # a west side
+_H3 = "\u2501" * 3                           # horizontal wall
+_SP3 = "   "                                 # horizontal passage
+
 class Rectangular_Grid(Grid):
     """rectangular grid implementation"""
 
@@ -71,29 +90,51 @@ class Rectangular_Grid(Grid):
         self.origin = kwargs["origin"] if "origin" in kwargs else (0, 0)
         self.scale = kwargs["scale"] if "scale" in kwargs else 1
         self.inset = kwargs["inset"] if "inset" in kwargs else 0
+        self._rowmajor = None         # cached traversals
+        self._colmajor = None
 
         super().__init__(**kwargs)
 
     def initialize(self):
         """grid initialization, e.g. create cells"""
         h, k = self.origin
+        xs = [self.scale * j + h for j in range(self.cols)]
         for i in range(self.rows):
+            y = self.scale * i + k
             for j in range(self.cols):
-                x = self.scale * j + h
-                y = self.scale * i + k
+                x = xs[j]
                 name = "C[%d,%d]" % (i, j)      # added 30 Apr 2020
                 cell = Square_Cell(i, j, position=(x, y), scale=self.scale,
                                    inset=self.inset, name=name)
                 self[i, j] = cell
 
+    def __setitem__(self, index, cell):
+        """associate the cell with the given index"""
+        self._rowmajor = self._colmajor = None
+        return super().__setitem__(index, cell)
+
+    def __delitem__(self, index):
+        """remove the cell with the given index"""
+        self._rowmajor = self._colmajor = None
+        super().__delitem__(index)
+
     def configure(self):
         """grid configuration, e.g. configure neighborhoods"""
+        add_passages = "wallAdder" in self.kwargs
         for i in range(self.rows):
             for j in range(self.cols):
-                self.configure_topology(i, j)   # ignore return value
+                self.configure_topology(i, j, add_passages)
+
+    def configure_topology(self, i, j, add_passages=None):
+        """configure neighborhood for a given cell
+
+        Mandatory arguments:
+            i, j - the row and column of the cell
 
-    def configure_topology(self, i, j):
-        """configure neighborhood for a given cell"""
+        Optional arguments:
+            add_passages - if true, passages are carved north and east;
+                if None (the default), the wallAdder option is checked
+        """
             #   pylint: disable=multiple-statements
             #           reason: simple conditions
         cell = self[i, j]
@@ -108,7 +149,9 @@ class Rectangular_Grid(Grid):
         west = self[i, j-1]
         if west: cell["west"] = west            # 15-05-2020
 
-        if "wallAdder" in self.kwargs:
+        if add_passages is None:
+            add_passages = "wallAdder" in self.kwargs
+        if add_passages:
             if north: cell.makePassage(north)
             if east: cell.makePassage(east)
 
@@ -132,15 +175,17 @@ class Rectangular_Grid(Grid):
 
     def each_rowcol(self):
         """iterate by row and column (row major order)"""
-        for i in range(self.rows):
-            for j in range(self.cols):
-                yield self[i, j]
+        if self._rowmajor is None:
+            self._rowmajor = tuple(self[i, j] for i in range(self.rows)
+                                   for j in range(self.cols))
+        return iter(self._rowmajor)
 
     def each_colrow(self):
         """iterate by column and row (column major order)"""
-        for j in range(self.cols):
-            for i in range(self.rows):
-                yield self[i, j]
+        if self._colmajor is None:
+            self._colmajor = tuple(self[i, j] for j in range(self.cols)
+                                   for i in range(self.rows))
+        return iter(self._colmajor)
 
         # display of mazes
 
@@ -156,38 +201,25 @@ class Rectangular_Grid(Grid):
             if not content: return ' '
             return content[0]
 
-        s = ""
+        parts = []                                # joined at the end
         for i in range(self.rows - 1, -1, -1):    # north to south
+            row = [self[i, j] for j in range(self.cols)]
+            north = [cell.status("north") for cell in row]
+            west = [cell.status("west") for cell in row]
                 # top
-            for j in range(self.cols):
-                cell = self[i, j]
-                if cell.status("north"):
-                    s += "+   "
-                else:
-                    s += "+---"
-            s += "+\n"                            # close out top
+            parts.append("".join(_OPEN_N if n else _WALL_N for n in north))
+            parts.append("+\n")                   # close out top
                 # middle
-            for j in range(self.cols):
-                cell = self[i, j]
-                if cell.status("west"):
-                    s += "  " + get_content(cell) + " "
-                else:
-                    s += "| " + get_content(cell) + " "
-            cell = self[i, self.cols-1]               # close out middle
-            if cell.status("east"):
-                s += " \n"                            # non-planar embeddings
-            else:
-                s += "|\n"
+            parts.append("".join((_OPEN_W if w else _WALL_W) \
+                + get_content(cell) + " " for w, cell in zip(west, row)))
+                                                  # close out middle
+            parts.append(" \n" if row[-1].status("east") else "|\n")
 
             # and finally, the bottom of row 0
-        for j in range(self.cols):
-            cell = self[0, j]
-            if cell.status("south"):
-                s += "+   "                       # non-planar embeddings
-            else:
-                s += "+---"
-        s += "+"
-        return s
+        south = [self[0, j].status("south") for j in range(self.cols)]
+        parts.append("".join(_OPEN_N if s else _WALL_N for s in south))
+        parts.append("+")
+        return "".join(parts)
 
     def unicode(self):
         """cast to unicode"""
@@ -201,44 +233,32 @@ class Rectangular_Grid(Grid):
             if not content: return ' '
             return content[0]
 
-        s = ""
+        parts = []                                # joined at the end
         for i in range(self.rows - 1, -1, -1):    # north to south
+            row = [self[i, j] for j in range(self.cols)]
+            north = [cell.status("north") for cell in row]
+            west = [cell.status("west") for cell in row]
                 # top
-            corner = "\u250f" if i + 1 == self.rows else "\u2523"
-            for j in range(self.cols):
-                s += corner
-                corner = "\u2533" if i + 1 == self.rows else "\u254b"
-                cell = self[i, j]
-                if cell.status("north"):
-                    s += "   "                        # non-planar embeddings
-                else:
-                    s += "\u2501" * 3
-            corner = "\u2513" if i + 1 == self.rows else "\u252b"
-            s += corner + "\n"                        # close out top
-                # middle
-            for j in range(self.cols):
-                cell = self[i, j]
-                if cell.status("west"):
-                    s += "  " + get_content(cell) + " "
-                else:
-                    s += "\u2503 " + get_content(cell) + " "
-            cell = self[i, self.cols-1]               # close out middle
-            if cell.status("east"):
-                s += " \n"                            # non-planar embeddings
+            if i + 1 == self.rows:
+                first, inner, last = _TL, _T, _TR
             else:
-                s += "\u2503\n"
+                first, inner, last = _L, _X, _R
+            parts.append(first)
+            parts.append(inner.join(_SP3 if n else _H3 \
+                for n in north))                # non-planar embeddings
+            parts.append(last + "\n")             # close out top
+                # middle
+            parts.append("".join((_OPEN_W if w else _V1) \
+                + get_content(cell) + " " for w, cell in zip(west, row)))
+                                                  # close out middle
+            parts.append(" \n" if row[-1].status("east") else _V + "\n")
 
             # and finally, the bottom of row 0
-        corner = "\u2517"
-        for j in range(self.cols):
-            s += corner
-            corner = "\u253b"
-            cell = self[0, j]
-            if cell.status("south"):
-                s += "   "                            # non-planar embeddings
-            else:
-                s += "\u2501" * 3
-        s += "\u251b"
-        return s
+        south = [self[0, j].status("south") for j in range(self.cols)]
+        parts.append(_BL)
+        parts.append(_B.join(_SP3 if s else _H3 \
+            for s in south))                    # non-planar embeddings
+        parts.append(_BR)
+        return "".join(parts)
 
 # END: rectangular_grid.py
@@ -18,6 +18,12 @@
 #
 # Maintenance History:
 #     15 May 2020 - Initial version
+#     16 Oct 2026 - Cache static neighborhoods in on()
+#       Pick neighbors with a bound randrange
+#       Reuse the list of unvisited neighbors
+#       Cache ordered static neighborhoods in deterministic_on()
+#       Test for visits without building passage lists
+#       Drop loops in grid when building the neighborhoods
 """
 recursive_backtracker.py - the recursive backtracker (dfs) algorithm
 Copyright ©2020 by Eric Conrad
@@ -60,25 +66,33 @@ class Recursive_Backtracker:
     @classmethod
     def on(cls, grid, start=None):
         """carve a spanning tree maze using random depth-first search"""
-        import random
+        from random import randrange
 
                 # start somewhere
         cell = start if start else grid.choice()
         stack = [cell]
+        neighborhoods = {}                # cache of static neighborhoods
+        nbrs = []                         # reused for each visit
 
         while stack:
             cell = stack[-1]              # look at the top of the stack
 
-            nbrs = []
-            for nbr in cell.each_neighbor():
-                if nbr.passages():
+                # a cell is revisited once for each of its children
+            neighborhood = neighborhoods.get(cell)
+            if neighborhood is None:      # (skipping any loops in grid)
+                neighborhood = tuple(nbr for nbr in cell.each_neighbor() \
+                    if nbr is not cell)
+                if cell.static_neighborhood:
+                    neighborhoods[cell] = neighborhood
+
+            nbrs.clear()
+            for nbr in neighborhood:
+                if nbr.arcs:
                     continue                  # already visited
-                if nbr is cell:
-                    continue                  # loop in grid
                 nbrs.append(nbr)          # not yet visited
 
             if nbrs:                      # there are unvisited neighbors
-                nbr = random.choice(nbrs)     # pick one
+                nbr = nbrs[randrange(len(nbrs))]  # pick one
                 stack.append(nbr)
                 cell.makePassage(nbr)
             else:                         # dead end
@@ -92,19 +106,24 @@ class Recursive_Backtracker:
                 # start somewhere
         cell = start if start else grid.choice()
         stack = [cell]
+        neighborhoods = {}                # cache of static neighborhoods
 
         while stack:
             cell = stack[-1]              # look at the top of the stack
 
+                # the neighbors in the supplied order of directions
+            neighborhood = neighborhoods.get(cell)
+            if neighborhood is None:      # (skipping any loops in grid)
+                neighborhood = tuple(nbr for nbr in \
+                    (cell[direction] for direction in directions) \
+                    if nbr and nbr is not cell)
+                if cell.static_neighborhood:
+                    neighborhoods[cell] = neighborhood
+
             nbr = None
-            for direction in directions:  # we query the supplied directions
-                candidate = cell[direction]
-                if not candidate:
-                    continue                  # missing direction
-                if candidate.passages():
+            for candidate in neighborhood:
+                if candidate.arcs:
                     continue                  # already visited
-                if candidate is cell:
-                    continue                  # loop in grid
                 nbr = candidate           # not yet visited
                 break                     # found!
 
@@ -20,6 +20,9 @@
 ##############################################################################
 # Maintenance History:
 #     2 May 2020 - Initial version
+#     16 Oct 2026 - Count arcs and components in a single traversal
+#       Lay out the rectangular display with neato
+#       Only render with GraphViz if requested (--render)
 ##############################################################################
 """
 aldous_broder_demo.py - test the Aldous/Broder algorithms implementation
@@ -35,10 +38,9 @@ References:
     # pylint: disable=redefined-outer-name
     #     reason: grid, m and n are standard names for these variables
 
+import argparse
 from rectangular_grid import Rectangular_Grid
 from recursive_backtracker import Recursive_Backtracker as DFS
-from layout_graphviz import Layout
-from helpers import Helper
 
 def make_maze(m, n, maze_name, nonrandom):
     """create a maze"""
@@ -59,15 +61,21 @@ def display_unicode(grid):
 
 def display_tree(grid, pathname):
     """display the maze as a tree using dot"""
+    from layout_graphviz import Layout
+
     dot = Layout(grid, filename=pathname)
     dot.draw()
     dot.render()                          # rooted tree
 
 def display_maze(grid, pathname):
     """display the maze preserving its rectangular geometry"""
+    from layout_graphviz import Layout
+
     source = grid[m-1, n-1]               # start cell
     terminus = grid[0, 0]                 # finish cell
-    dot = Layout(grid, engine='fdp', filename=pathname)
+        # the cells are pinned in place by set_square_cells, so neato
+        # has nothing to solve (fdp would iterate a force simulation)
+    dot = Layout(grid, engine='neato', filename=pathname)
     dot.set_square_cells()
     dot.set_cell(source, label='Start')
     dot.set_cell(terminus, label='End')
@@ -91,27 +99,46 @@ def check_maze(grid):
     m, n = grid.rows, grid.cols
     v = m * n                             # number of vertices
     e = 0                                 # number of arcs (2e)
-    for cell in grid.each():
-        e += len(cell.arcs)                   # Euler counting
-    k, _ = Helper.find_components(grid)
+    k = 0                                 # number of components
+    visited = set()
+    for start in grid.each():
+        if start in visited:
+            continue
+        k += 1                                # a new component
+        stack = [start]
+        while stack:
+            cell = stack.pop()
+            if cell in visited:
+                continue
+            visited.add(cell)
+            e += len(cell.arcs)                   # Euler counting
+            stack.extend(nbr for nbr in cell.arcs if nbr not in visited)
         # note: e is twice the number of edges
     assert e + 2 == 2 * v and k == 1, \
         "v=%d, 2*e=%d, k=%d - not a tree" % (v, e, k)
 
+desc = "demonstration of depth-first search (recursive backtracker)"
+parser = argparse.ArgumentParser(description=desc)
+parser.add_argument('--render', action='store_true', \
+    help='render the mazes using GraphViz (slow)')
+args = parser.parse_args()
+
 m, n = 5, 7                           # small rectangular mazes
 
 print("1. DFS - randomized - small maze")
 grid = make_maze(m, n, "DFS1", False)
 display_unicode(grid)
-display_tree(grid, 'demos/dfs_tree1.gv')
-display_maze(grid, 'demos/dfs_maze1.gv')
+if args.render:
+    display_tree(grid, 'demos/dfs_tree1.gv')
+    display_maze(grid, 'demos/dfs_maze1.gv')
 check_maze(grid)
 
 print("2. DFS - deterministic - small maze")
 grid = make_maze(m, n, "DFS2", True)
 display_unicode(grid)
-display_tree(grid, 'demos/dfs_tree2.gv')
-display_maze(grid, 'demos/dfs_maze2.gv')
+if args.render:
+    display_tree(grid, 'demos/dfs_tree2.gv')
+    display_maze(grid, 'demos/dfs_maze2.gv')
 check_maze(grid)
 
 m, n = 30, 20                         # large rectangular mazes
@@ -119,7 +146,8 @@ m, n = 30, 20                         # large rectangular mazes
 
 print("3. DFS - randomized - larger maze")
 grid = make_maze(m, n, "DFS3", False)
-display_maze(grid, 'demos/dfs_maze3.gv')
+if args.render:
+    display_maze(grid, 'demos/dfs_maze3.gv')
 check_maze(grid)
 
 # END: recursive_backtracker_demo.py
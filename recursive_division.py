@@ -18,6 +18,18 @@
 #
 # Maintenance History:
 #     12 Aug 2020 - Initial version
+#     16 Oct 2026 - Bind the state methods once in on()
+#       Keep the golden flag as an attribute of the state
+#       Copy the shadow maze in a single pass
+#       Resolve the carving algorithms once per state
+#       Reuse shadow grids of the same shape
+#       Look up cells in a table of rows instead of indexing the grid
+#       Represent shapes and doors as tuples
+#       Draw the partitions with randrange
+#       Carve single rows and columns without a shadow maze
+#       Tabulate the golden partition bounds
+#       Import the default texture algorithms once
+#       Read the shadow passages straight from the shadow cells
 """
 recursive_division.py - carving a spanning tree by recursive division
 Copyright ©2020 by Eric Conrad
@@ -45,7 +57,7 @@ Bugs and Features:
 """
 
 from math import sqrt
-from random import randint, choice
+from random import randrange, choice
 from rectangular_grid import Rectangular_Grid
 from sidewinder import Sidewinder 
 
@@ -74,9 +86,10 @@ class Recursive_Division:
         and "carve_shadow".  For creating a door between two partitions,
         see "make_doorway".
 
-        Method "carve_shadow" creates a grid of the required shape
-        and creates a maze on the grid using the "on" class-method
-        of the indicated algorithm:
+        Method "carve_shadow" is passed a grid of the required shape
+        (grids of the same shape are reused, with their passages
+        cleared) and creates a maze on the grid using the "on"
+        class-method of the indicated algorithm:
 
             algorithm.on(grid)
 
@@ -94,11 +107,17 @@ class Recursive_Division:
             """constructor"""
             self.grid = grid
             self.kwargs = kwargs
+                # the cells of the grid, indexed as cells[row][column]
+            self.cells = [[grid[i, j] for j in range(grid.cols)] \
+                for i in range(grid.rows)]
             self.delta = kwargs["delta"] if "delta" in kwargs else 1
             if self.delta < 1:
                 self.delta = 1
+            self.algorithm = kwargs["algorithm"] \
+                if "algorithm" in kwargs else Sidewinder
             self.initialize()
             self.stack = []
+            self.shadows = {}         # shadow grids, reused by shape
 
         def initialize(self):
             """for use by subclasses"""
@@ -114,7 +133,7 @@ class Recursive_Division:
 
             Parameters:
                 shape - a rectangle specified by (row,column) indices
-                  in format [[r0,c0],[r1,c1]] where (r0,c0) is the
+                  in format ((r0,c0),(r1,c1)) where (r0,c0) is the
                   lower left corner and (r1,c1) is the upper right
                   corner.
 
@@ -124,20 +143,20 @@ class Recursive_Division:
             Returns:
                 Two shapes and the indices of the door cells.
             """
-            [[r0, c0], [r1, c1]] = shape      # a rectangle
+            (r0, c0), (r1, c1) = shape        # a rectangle
 
             if r1 - r0 > c1 - c0:             # more rows than columns
-                r2 = randint(r0 + 1, r1)          # partition row
-                shape1 = [[r0, c0], [r2-1, c1]]
-                shape2 = [[r2 ,c0], [r1, c1]]
-                c2 = randint(c0, c1)
-                door = [[r2-1, c2], [r2, c2]]
+                r2 = randrange(r0 + 1, r1+1)        # partition row
+                shape1 = ((r0, c0), (r2-1, c1))
+                shape2 = ((r2, c0), (r1, c1))
+                c2 = randrange(c0, c1+1)
+                door = ((r2-1, c2), (r2, c2))
             else:
-                c2 = randint(c0 + 1, c1)          # partition column
-                shape1 = [[r0, c0], [r1, c2-1]]
-                shape2 = [[r0 ,c2], [r1, c1]]
-                r2 = randint(r0, r1)
-                door = [[r2, c2-1], [r2, c2]]
+                c2 = randrange(c0 + 1, c1+1)        # partition column
+                shape1 = ((r0, c0), (r1, c2-1))
+                shape2 = ((r0, c2), (r1, c1))
+                r2 = randrange(r0, r1+1)
+                door = ((r2, c2-1), (r2, c2))
             return (shape1, shape2, door)
 
                 # sizing criteria
@@ -150,14 +169,14 @@ class Recursive_Division:
 
             Parameters:
                 shape - a rectangle specified by (row,column) indices
-                  in format [[r0,c0],[r1,c1]] where (r0,c0) is the
+                  in format ((r0,c0),(r1,c1)) where (r0,c0) is the
                   lower left corner and (r1,c1) is the upper right
                   corner.
 
             Returns:
                 Tne smaller of the row width and the column width.
             """
-            [[r0, c0], [r1, c1]] = shape
+            (r0, c0), (r1, c1) = shape
             delta1 = r1 - r0      # number of rows - 1
             delta2 = c1 - c0      # number of columns - 1
             return min(delta1, delta2) + 1
@@ -172,10 +191,8 @@ class Recursive_Division:
                 door - a two-cell rectangle specified by (row,column)
                   indices.
             """
-            [[r0, c0], [r1, c1]] = door
-            cell = self.grid[r0, c0]
-            nbr = self.grid[r1, c1]
-            cell.makePassage(nbr)
+            (r0, c0), (r1, c1) = door
+            self.cells[r0][c0].makePassage(self.cells[r1][c1])
 
                 # carving small shapes
 
@@ -186,9 +203,7 @@ class Recursive_Division:
                 # a chain.  Sidewinder should be satisfactory for
                 # small grids.
 
-            algorithm = self.kwargs["algorithm"] \
-                if "algorithm" in self.kwargs else Sidewinder
-            algorithm.on(shadow_grid)
+            self.algorithm.on(shadow_grid)
 
         def carve(self, shape):
             """carve a maze in the given partition
@@ -198,31 +213,45 @@ class Recursive_Division:
 
             Parameters:
                 shape - a rectangle specified by (row,column) indices
-                  in format [[r0,c0],[r1,c1]] where (r0,c0) is the
+                  in format ((r0,c0),(r1,c1)) where (r0,c0) is the
                   lower left corner and (r1,c1) is the upper right
                   corner.
+
+            A single row or a single column has only one spanning
+            tree, a chain, so it is carved directly without a shadow
+            maze.
             """
-            [[r0, c0], [r1, c1]] = shape
-            shadow_maze = Rectangular_Grid(r1-r0+1, c1-c0+1)
+            (r0, c0), (r1, c1) = shape
+            if r0 == r1:                      # a single row
+                row = self.cells[r0]
+                for j in range(c0, c1):
+                    row[j].makePassage(row[j+1])
+                return
+            if c0 == c1:                      # a single column
+                cells = self.cells
+                for i in range(r0, r1):
+                    cells[i][c0].makePassage(cells[i+1][c0])
+                return
+
+            size = (r1-r0+1, c1-c0+1)
+            shadow_maze = self.shadows.get(size)
+            if shadow_maze is None:
+                shadow_maze = self.shadows[size] = Rectangular_Grid(*size)
+            else:
+                shadow_maze.clear_passages()
             self.carve_shadow(shadow_maze)
 
-                # get the edges in the shadow
-            edges = {}
-            for i in range(r0, r1+1):
-                for j in range(c0, c1+1):
-                    cell = shadow_maze[i-r0, j-c0]
-                    for nbr in cell.passages():
-                        edge = frozenset([cell, nbr])
-                        edges[edge] = 1
-
-                # carve the shadowed edges in the grid
-            for edge in edges:
-                cell, nbr = edge
-                i, j = cell.index
-                h, k = nbr.index
-                cell = self.grid[i+r0, j+c0]
-                nbr = self.grid[h+r0, k+c0]
-                cell.makePassage(nbr)
+                # carve the shadowed edges in the grid -- each edge
+                # is found once, from its southern or western cell
+            cells = self.cells
+            for shadow in shadow_maze.each_rowcol():
+                i, j = shadow.index
+                topology, arcs = shadow.topology, shadow.arcs
+                cell = cells[i+r0][j+c0]
+                if topology.get("north") in arcs:
+                    cell.makePassage(cells[i+r0+1][j+c0])
+                if topology.get("east") in arcs:
+                    cell.makePassage(cells[i+r0][j+c0+1])
 
                 # when do we recurse? This is the heart of the
                 # matter
@@ -232,7 +261,7 @@ class Recursive_Division:
 
             Parameters:
                 shape - e.g. a rectangle specified by (row,column)
-                  indices in format [[r0,c0],[r1,c1]] where (r0,c0)
+                  indices in format ((r0,c0),(r1,c1)) where (r0,c0)
                   is the lower left corner and (r1,c1) is the upper
                   right corner.
 
@@ -267,19 +296,25 @@ class Recursive_Division:
         if not state:
             state = cls.State(grid, **kwargs)
 
-        shape = [[0, 0], [grid.rows-1, grid.cols-1]]
-        state.stack.append(shape)
-        while state.stack:
+            # the state methods are looked up once, not once per shape
+        stack = state.stack
+        push, pop = stack.append, stack.pop
+        decision_procedure = state.decision_procedure
+        make_doorway = state.make_doorway
+
+        shape = ((0, 0), (grid.rows-1, grid.cols-1))
+        push(shape)
+        while stack:
             #print("POP: %s" % shape)
-            shape = state.stack.pop()
-            shape1, shape2, door = state.decision_procedure(shape)
+            shape = pop()
+            shape1, shape2, door = decision_procedure(shape)
             #print("PARTITION: %s, %s, %s" % (shape1, shape2, door))
             if door:
-                state.make_doorway(door)
+                make_doorway(door)
             if shape1:
-                state.stack.append(shape1)
+                push(shape1)
             if shape2:
-                state.stack.append(shape2)
+                push(shape2)
 
 # ---------------------------------------------------------------------
 # Additional state classes
@@ -293,8 +328,12 @@ class Golden_State(Recursive_Division.State):
         phi = (1+sqrt(5))/2       # golden section, mean-extreme ratio
         self.hi = phi - 1         # = 1/phi ≈ 0.618
         self.lo = 1 - self.hi     # ≈ 0.382
+            # the bounds for the partition, indexed by the span
+        spans = range(max(self.grid.rows, self.grid.cols) + 1)
+        self.lo_bounds = [int(self.lo * span) + 1 for span in spans]
+        self.hi_bounds = [int(self.hi * span) for span in spans]
             # normal setting: golden=True
-        self.kwargs["golden"] = \
+        self.golden = self.kwargs["golden"] = \
             "golden" not in self.kwargs or self.kwargs["golden"]
 
     def partition(self, shape):
@@ -309,7 +348,7 @@ class Golden_State(Recursive_Division.State):
 
         Parameters:
             shape - a rectangle specified by (row,column) indices in
-              format [[r0,c0],[r1,c1]] where (r0,c0) is the lower left
+              format ((r0,c0),(r1,c1)) where (r0,c0) is the lower left
               corner and (r1,c1) is the upper right corner.
 
         Preconditions:
@@ -318,31 +357,31 @@ class Golden_State(Recursive_Division.State):
         Returns:
             Two shapes and the indices of the door cells.
         """
-        if not self.kwargs["golden"]:
+        if not self.golden:
                 # simple partitioning if golden is False
             return super().partition(shape)
 
             # quasi-Fibonacci partitioning
-        [[r0, c0], [r1, c1]] = shape      # a rectangle
+        (r0, c0), (r1, c1) = shape        # a rectangle
 
         if r1 - r0 > c1 - c0:             # more rows than columns
-            a = int(self.lo * (r1 - r0 + 1)) + 1
-            b = int(self.hi * (r1 - r0 + 1))
-            r2 = randint(a, b) if a<b else (r1 - r0 + 1) // 2
+            a = self.lo_bounds[r1 - r0 + 1]
+            b = self.hi_bounds[r1 - r0 + 1]
+            r2 = randrange(a, b+1) if a<b else (r1 - r0 + 1) // 2
             r2 += r0                          # partition row
-            shape1 = [[r0, c0], [r2-1, c1]]
-            shape2 = [[r2 ,c0], [r1, c1]]
-            c2 = randint(c0, c1)
-            door = [[r2-1, c2], [r2, c2]]
+            shape1 = ((r0, c0), (r2-1, c1))
+            shape2 = ((r2, c0), (r1, c1))
+            c2 = randrange(c0, c1+1)
+            door = ((r2-1, c2), (r2, c2))
         else:
-            a = int(self.lo * (c1 - c0 + 1)) + 1
-            b = int(self.hi * (c1 - c0 + 1))
-            c2 = randint(a, b) if a<b else (c1 - c0 + 1) // 2
+            a = self.lo_bounds[c1 - c0 + 1]
+            b = self.hi_bounds[c1 - c0 + 1]
+            c2 = randrange(a, b+1) if a<b else (c1 - c0 + 1) // 2
             c2 += c0                          # partition column
-            shape1 = [[r0, c0], [r1, c2-1]]
-            shape2 = [[r0 ,c2], [r1, c1]]
-            r2 = randint(r0, r1)
-            door = [[r2, c2-1], [r2, c2]]
+            shape1 = ((r0, c0), (r1, c2-1))
+            shape2 = ((r0, c2), (r1, c1))
+            r2 = randrange(r0, r1+1)
+            door = ((r2, c2-1), (r2, c2))
         return (shape1, shape2, door)
 
 class Random_Texture_State(Golden_State):
@@ -357,21 +396,32 @@ class Random_Texture_State(Golden_State):
             in Golden_State.  If false, it works like the partitioning
             in Recursive_Division.State.  (default: golden=False)
     """
-    def initialize(self):
-        """initializations"""
-        if "algorithms" not in self.kwargs:
+    _defaults = None              # see _default_algorithms
+
+    @classmethod
+    def _default_algorithms(cls):
+        """the default algorithms (imported on first use)"""
+        if cls._defaults is None:
             from binary_tree import Binary_Tree
             from aldous_broder import Aldous_Broder
             from prims import Prims
             from recursive_backtracker import Recursive_Backtracker
             from hunt_and_kill import Hunt_and_Kill
 
-            self.kwargs["algorithms"] = \
-                [Binary_Tree, Sidewinder, Aldous_Broder, Prims, \
-                    Recursive_Backtracker, Hunt_and_Kill]
+            cls._defaults = \
+                (Binary_Tree, Sidewinder, Aldous_Broder, Prims, \
+                    Recursive_Backtracker, Hunt_and_Kill)
+        return cls._defaults
+
+    def initialize(self):
+        """initializations"""
+        if "algorithms" not in self.kwargs:
+            self.kwargs["algorithms"] = self._default_algorithms()
+
+        self.algorithms = tuple(self.kwargs["algorithms"])
 
             # normal setting: golden=False
-        self.kwargs["golden"] = \
+        self.golden = self.kwargs["golden"] = \
             "golden" in self.kwargs and self.kwargs["golden"]
 
             # require delta >= 2 (default delta=5)
@@ -380,7 +430,6 @@ class Random_Texture_State(Golden_State):
 
     def carve_shadow(self, shadow_grid):
         """carve a shadow maze"""
-        self.kwargs["algorithm"] = choice(self.kwargs["algorithms"])
-        super().carve_shadow(shadow_grid)
+        choice(self.algorithms).on(shadow_grid)
 
 # END: recursive_division.py
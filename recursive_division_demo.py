@@ -20,6 +20,8 @@
 ##############################################################################
 # Maintenance History:
 #     13 Aug 2020 - Initial version
+#     16 Oct 2026 - Reuse the figure for mazes of the same shape
+#       Set the cell colors in bulk
 ##############################################################################
 """
 recursive_division_demo.py - demonstrate recursive division
@@ -58,6 +60,18 @@ def generate_maze(grid, state=None, **kwargs):
     Recursive_Division.on(grid, state, **kwargs)
     print("Done!")
 
+_FIGURES = {}               # (Figure, Axes) pairs by maze shape
+
+def get_figure(maze):
+    """get a figure for a maze, reusing any figure of the same shape"""
+    shape = (maze.rows, maze.cols)
+    if shape in _FIGURES:
+        fig, ax = _FIGURES[shape]
+        ax.clear()                          # forget the previous maze
+    else:
+        fig, ax = _FIGURES[shape] = plt.subplots(1, 1)
+    return fig, ax
+
 def render(maze, filename, title, debug=False):
     """render a mazes
     
@@ -71,13 +85,18 @@ def render(maze, filename, title, debug=False):
 
         # generate the plots
     print("Plotting...\n%s" % title)
-    layout = Color_Layout(maze, plt, title=title)
+    layout = Color_Layout(maze, plt, figure=get_figure(maze), title=title)
     layout.ax.set(aspect=1)
     layout.ax.axis('off')
     layout.palette[0] = "yellow"
     layout.palette[1] = "brown"
-    for cell in maze.each():
-        layout.color[cell] = 1 if "underCell" in cell.kwargs else 0
+    colors = dict.fromkeys(maze.each(), 0)
+    if hasattr(maze, "under_cells"):            # weave maze
+        colors.update(dict.fromkeys(maze.under_cells, 1))
+    else:
+        colors.update({cell: 1 for cell in colors \
+            if "underCell" in cell.kwargs})
+    layout.set_colors(colors)
     layout.draw_grid()
     layout.render(filename)
     if debug:
@@ -21,6 +21,14 @@
 #     22 Apr 2020 - Initial version
 #     3 May 2020 - Cleanup with pylint3
 #     15 May 2020 - Use cell topology management functions.
+#     16 Oct 2026 - Pass the cell generator as an argument instead of
+#         storing it in the class
+#       Look up the upward neighbor once per cell
+#       Skip the coin flip when the bias makes the outcome certain
+#       Reuse the run list instead of allocating a new one
+#       Accept an optional random number generator
+#       Drop the chosen passage from a run without shifting the run
+#       Read both neighbors directly from the cell topology
 #######################################################################
 """
 sidewinder.py - a spanning tree implementation
@@ -80,13 +88,9 @@ Bugs and Features:
 class Sidewinder:
     """implementation of the sidewinder algorithm"""
 
-    GENERATOR = None
-
     @classmethod
     def fetch_generator(cls, grid, forward, upward):
         """find a generator connected with the forward/upward pair"""
-        if Sidewinder.GENERATOR:
-            return Sidewinder.GENERATOR
         config = [forward, upward]
         if forward == "east":
             return grid.each_rowcol
@@ -96,12 +100,8 @@ class Sidewinder:
              % str(config))
 
     @classmethod
-    def store_generator(cls, generator):
-        """save the generator connected with the forward/upward pair"""
-        Sidewinder.GENERATOR = generator
-
-    @classmethod
-    def on(cls, grid, forward="east", upward="north", bias=0.5):
+    def on(cls, grid, forward="east", upward="north", bias=0.5,
+           each=None, rng=None):
         """carve a spanning tree maze using sidewinder (passage carver)
 
         Preconditions:
@@ -115,38 +115,49 @@ class Sidewinder:
             upward (default is northward) - an independent direction
             bias (default is 50%) - the percentage of heads in the coin flip
                 This is a float, so 50% is 0.5, 75% is 0.75, etc.
+            each (default depends on forward) - a generator method which
+                visits the cells in the order needed for the given forward
+                and upward directions, e.g. grid.each_rowcol
+            rng (default is the random module) - a source of random
+                numbers, e.g. random.Random(seed) for a reproducible maze
         """
-        from random import random, choice
-
-        each = Sidewinder.fetch_generator(grid, forward, upward)
+        if not rng:
+            import random as rng
+        random, choice = rng.random, rng.choice
+
+        if not each:
+            each = cls.fetch_generator(grid, forward, upward)
+        certain = bias <= 0 or bias >= 1    # the coin is not fair
+        heads = bias >= 1
         run = []
         for cell in each():
-            if cell.status(upward) is False:    # can tear down upward wall
-                run.append([cell, cell[upward]])    # 15-05-2020
-            nbr = cell[forward]                 # 15-05-2020
+            neighbor = cell.topology.get
+            up = neighbor(upward)
+            if up and up not in cell.arcs:      # can tear down upward wall
+                run.append([cell, up])
+            nbr = neighbor(forward)
 
             if nbr:                         # can go forward
                 if run:                         # can go upward
                         # we have a choice: flip a coin
-                    if random() < bias:
+                    if heads if certain else random() < bias:
                         cell.makePassage(nbr)
                     else:
                             # close out run
                         cell1, cell2 = choice(run)
                         cell1.makePassage(cell2)
-                        run = []
+                        run.clear()
                 else:                           # can only go forward
                     cell.makePassage(nbr)
             elif run:                       # can only go upward
                     # close out run
                 cell1, cell2 = choice(run)
                 cell1.makePassage(cell2)
-                run = []
-        Sidewinder.GENERATOR = None         # clean up
+                run.clear()
 
     @classmethod
     def wallBuilder_on(cls, grid, forward="east", upward="north",
-                       bias=0.5):
+                       bias=0.5, each=None, rng=None):
         """carve a spanning tree maze using sidewinder (wall builder)
 
         Preconditions:
@@ -160,34 +171,47 @@ class Sidewinder:
             upward (default is northward) - an independent direction
             bias (default is 50%) - the percentage of heads in the coin flip
                 This is a float, so 50% is 0.5, 75% is 0.75, etc.
+            each (default depends on forward) - a generator method which
+                visits the cells in the order needed for the given forward
+                and upward directions, e.g. grid.each_rowcol
+            rng (default is the random module) - a source of random
+                numbers, e.g. random.Random(seed) for a reproducible maze
         """
-        from random import random, randrange
-
-        each = Sidewinder.fetch_generator(grid, forward, upward)
+        if not rng:
+            import random as rng
+        random, randrange = rng.random, rng.randrange
+
+        if not each:
+            each = cls.fetch_generator(grid, forward, upward)
+        certain = bias <= 0 or bias >= 1    # the coin is not fair
+        tails = bias <= 0
         run = []
         for cell in each():
-            if cell.status(upward):         # can erect upward wall
-                run.append([cell, cell[upward]])  # 15-05-2020
-            nbr = cell[forward]             # 15-05-2020
+            neighbor = cell.topology.get
+            up = neighbor(upward)
+            if up and up in cell.arcs:      # can erect upward wall
+                run.append([cell, up])
+            nbr = neighbor(forward)
 
             if nbr:                         # can go forward
                 if run:                         # can go upward
                         # we have a choice: flip a coin
-                    if random() > bias:
+                    if tails if certain else random() > bias:
                             # close out run
                         cell.erectWall(nbr)
                         n = randrange(len(run))
-                        run.pop(n)
+                        run[n] = run[-1]        # leave run[n] open
+                        run.pop()               # without shifting the tail
                         for cell1, cell2 in run:
                             cell1.erectWall(cell2)
-                        run = []
+                        run.clear()
             elif run:                       # can only go upward
                             # close out run
                 n = randrange(len(run))
-                run.pop(n)
+                run[n] = run[-1]        # leave run[n] open
+                run.pop()               # without shifting the tail
                 for cell1, cell2 in run:
                     cell1.erectWall(cell2)
-                run = []
-        Sidewinder.GENERATOR = None         # clean up
+                run.clear()
 
 # END: sidewinder.py
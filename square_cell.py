@@ -18,6 +18,7 @@
 #
 # Maintenance History:
 #     21 Apr 2020 - Initial version
+#     16 Oct 2026 - Declare __slots__
 """
 square_cell.py - square cell implementation for rectangular mazes
 Copyright ©2020 by Eric Conrad
@@ -43,6 +44,8 @@ from cell import Cell
 class Square_Cell(Cell):
     """square cell implementation"""
 
+    __slots__ = ("position", "scale", "inset")
+
     def __init__(self, row, col, **kwargs):
         """constructor
 
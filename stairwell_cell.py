@@ -18,6 +18,7 @@
 #
 # Maintenance History:
 #     14 Aug 2020 - Initial version
+#     16 Oct 2026 - Declare __slots__
 """
 stairwell_cell.py - up-down cell class for multi-level mazes
 Copyright ©2020 by Eric Conrad
@@ -40,6 +41,8 @@ from cell import Cell
 class Stairwell_Cell(Cell):
     """class for up-down cells in multi-level mazes"""
 
+    __slots__ = ()
+
     def __init__(self, index, downcell, upcell, **kwargs):
         """constructor
 
@@ -19,6 +19,9 @@
 # Maintenance History:
 #     22 Apr 2020 - Initial version
 #     15 May 2020 - Use cell topology management methods
+#     16 Oct 2026 - Tally the degree sequence with a Counter
+#       Read each cell's passages and neighbors once in Euler_edge_counts
+#       Add summary to gather the basic statistics in a single pass
 """
 statistics.py - statistics gathering
 Copyright ©2020 by Eric Conrad
@@ -53,6 +56,8 @@ Bugs:
     Unknown.
 """
 
+from collections import Counter
+
 class Maze_Statistics(object):
     """base class for statistics on grids and mazes"""
 
@@ -107,18 +112,13 @@ class Maze_Statistics(object):
         w = 0
         n = 0
         for cell in self.grid.each():
-            p += len(cell.arcs)
-            if cell in cell.arcs:
-                p += 1                  # loop (see note 3 above)
-            for direction in cell.each_direction():     # 15-05-2020
-                n += 1
-                nbr = cell[direction]                   # 15-05-2020
-                if nbr is cell:
-                    n += 1                  # loop (see note 3 above)
-                if nbr not in cell.arcs:
-                    w += 1
-                    if nbr is cell:
-                        w += 1              # loop (see note 3 above)
+            arcs = cell.arcs
+            p += len(arcs) + (cell in arcs)     # loop (see note 3 above)
+            for nbr in cell.topology.values():
+                loop = nbr is cell              # (see note 3 above)
+                n += 1 + loop
+                if nbr not in arcs:
+                    w += 1 + loop
         return (p, w, n)
 
     def degree_counts(self):
@@ -135,15 +135,37 @@ class Maze_Statistics(object):
         Degree 0 - isolated vertices
         Degree 1 - dead ends
         """
-        degrees = {}
+            # number of available passages, plus one for a loop
+        return dict(Counter(len(cell.arcs) + (cell in cell.arcs) \
+            for cell in self.grid.each()))
+
+    def summary(self):
+        """gather the basic statistics in a single pass over the grid
+
+        Returns:
+            the tuple (size, Euler edge counts, degree counts), i.e.
+                (self.size(), self.Euler_edge_counts(),
+                    self.degree_counts())
+
+        The statistics are not cached, so summary should be called again
+        after the maze is modified.
+        """
+        v = 0
+        p = 0
+        w = 0
+        n = 0
+        degrees = Counter()
         for cell in self.grid.each():
-            p = len(cell.arcs)              # number of available passages
-            if cell in cell.arcs:
-                p += 1                      # for a loop
-            if p in degrees:
-                degrees[p] += 1             # subsequent cell with degree
-            else:
-                degrees[p] = 1              # first cell in degree class
-        return degrees
+            v += 1
+            arcs = cell.arcs
+            deg = len(arcs) + (cell in arcs)    # loop counts twice
+            p += deg
+            degrees[deg] += 1
+            for nbr in cell.topology.values():
+                loop = nbr is cell
+                n += 1 + loop
+                if nbr not in arcs:
+                    w += 1 + loop
+        return (v, (p, w, n), dict(degrees))
 
 # END: statistics.py
@@ -20,6 +20,10 @@
 ##############################################################################
 # Maintenance History:
 #     29 Jul 2020 - Initial version
+#     16 Oct 2026 - Render with the non-interactive Agg backend
+#       Count the undercells using Weave_Grid.under_cells
+#       Set the cell colors in bulk
+#       In render, change pad_inched to pad_inches
 ##############################################################################
 """
 template_demo.py - demonstrate mazes constructed by templates
@@ -36,6 +40,8 @@ References:
 
         See especially the exercises at the end of chapter 10.
 """
+import matplotlib
+matplotlib.use("Agg")                  # we only save to files
 import matplotlib.pyplot as plt
 from grid_template import Grid_Template
 from layout_plot_color import Color_Layout
@@ -76,10 +82,7 @@ def generate_maze(grid):
 
     print("Hunt and kill...")
     Hunt_and_Kill.on(grid)
-    n = 0
-    for cell in grid.each():
-        if "underCell" in cell.kwargs:
-            n += 1
+    n = len(grid.under_cells)           # grid is a weave grid
     m = grid.rows * grid.cols
     print("Number of cells = %d, including %d undercells" % (m, n))
     print("Done!")
@@ -131,17 +134,17 @@ def render(mazes, filename, tweaker=tweak, titles=titles3):
         maze = mazes[j]
         ax = axs[j]
         layout = Color_Layout(maze, plt, figure=[fig, ax])
-        layout.palette[0] = "yellow"
-        layout.palette[1] = "green"
-        for cell in maze.each():
-            layout.color[cell] = 1 if "underCell" in cell.kwargs else 0
+        layout.set_palette({0: "yellow", 1: "green"})
+        colors = dict.fromkeys(maze.each(), 0)
+        colors.update(dict.fromkeys(maze.under_cells, 1))
+        layout.set_colors(colors)
         layout.draw_grid()
 
     print("Saved to " + filename)
     plt.subplots_adjust(hspace=.001, wspace=.001)
     plt.gca().xaxis.set_major_locator(plt.NullLocator())
     plt.gca().yaxis.set_major_locator(plt.NullLocator())
-    fig.savefig(filename, bbox_inches='tight', pad_inched=0.0)
+    fig.savefig(filename, bbox_inches='tight', pad_inches=0.0)
     # plt.show()
 
 if __name__ == "__main__":
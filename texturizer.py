@@ -20,6 +20,14 @@
 ##############################################################################
 # Maintenance History:
 #     16 May 2020 - Initial version
+#     16 Oct 2026 - Build the distance palette in one pass
+#       Batch the walls and patches of each subplot
+#       Resolve the algorithm once per plot array
+#       Make the set of valid algorithm strings immutable
+#       Render with the non-interactive Agg backend
+#       Color the cells straight from the distance table
+#       In render, change pad_inched to pad_inches
+#       Look up the algorithms in a dispatch table
 ##############################################################################
 """
 make_maze.py - a rectangular maze generator
@@ -32,16 +40,45 @@ References:
         Book (978-1-68050-055-4).
 """
 
-valid_algorithms = set(['AldousBroder', 'AB', 'ReverseAldousBroder', 'RAB', \
-    'AldousBroderWilson', 'ABW', 'BT', 'BinaryTree', 'BT2', 'BinaryTree2', \
-    'DFS', 'RBT', 'RecursiveBackTracker', 'HK', 'HuntKill', 'HuntAndKill', \
-    'NRDFS', 'Labyrinth', 'SW', 'Sidewinder', 'BFS', 'BreadthFirstSearch',
-    'HEAP', 'HeapSearch', 'W', 'Wilson'])
+    # The supported algorithms.  Each entry has the form:
+    #     (algorithm strings, module, class, method, bias keyword, base name)
+    # If the bias keyword is not None, the bias is passed to the method
+    # using the keyword.
+algorithm_table = [
+    (('AB', 'AldousBroder'), 'aldous_broder', 'Aldous_Broder', 'on',
+        None, 'AldousBroder'),
+    (('RAB', 'ReverseAldousBroder'), 'aldous_broder', 'Aldous_Broder',
+        'reverse_on', None, 'ReverseAldousBroder'),
+    (('ABW', 'AldousBroderWilson'), 'wilson', 'Wilson', 'hybrid_on',
+        'cutoff', 'AldousBroderWilson'),
+    (('BT', 'BinaryTree'), 'binary_tree', 'Binary_Tree', 'on',
+        'bias', 'BinaryTree'),
+    (('BT2', 'BinaryTree2'), 'binary_tree2', 'Binary_Tree', 'on',
+        None, 'BinaryTree2'),
+    (('DFS', 'RBT', 'RecursiveBackTracker'), 'recursive_backtracker',
+        'Recursive_Backtracker', 'on', None, 'RecursiveBacktracker'),
+    (('HK', 'HuntKill', 'HuntAndKill'), 'hunt_and_kill', 'Hunt_and_Kill',
+        'on', None, 'HuntAndKill'),
+    (('NRDFS', 'Labyrinth'), 'recursive_backtracker',
+        'Recursive_Backtracker', 'deterministic_on', None, 'Labyrinth'),
+    (('SW', 'Sidewinder'), 'sidewinder', 'Sidewinder', 'on',
+        'bias', 'Sidewinder'),
+    (('BFS', 'BreadthFirstSearch'), 'tree_search', 'Tree_Search',
+        'bfs_on', None, 'BreadthFirstSearch'),
+    (('HEAP', 'HeapSearch'), 'tree_search', 'Tree_Search', 'heap_on',
+        None, 'HeapSearch'),
+    (('W', 'Wilson'), 'wilson', 'Wilson', 'on', None, 'Wilson')]
+
+    # algorithm string -> (module, class, method, bias keyword, base name)
+algorithms = dict((key, entry[1:]) for entry in algorithm_table \
+    for key in entry[0])
+
+valid_algorithms = frozenset(algorithms)
 
 def make_epilog():
     """create the help epilog"""
     import textwrap
-    algorithms = sorted(list(valid_algorithms))
+    algorithms = sorted(valid_algorithms)
     epilog = "The supported algorithm strings are %s." \
         % str(algorithms)
     epilog = textwrap.fill(epilog)
@@ -58,71 +95,40 @@ def make_grid(m, n):
     grid = Rectangular_Grid(m, n)
     return grid
 
-def generate_maze(algorithm, grid, bias):
-    """generate a maze"""
-    print("Algorithm = %s, bias = %s" % (algorithm, str(bias)))
-    basename = None
-
-    if algorithm in ['AB', 'AldousBroder']:
-        from aldous_broder import Aldous_Broder
-        Aldous_Broder.on(grid)
-        basename = "AldousBroder"
-    elif algorithm in ['RAB', 'ReverseAldousBroder']:
-        from aldous_broder import Aldous_Broder
-        Aldous_Broder.reverse_on(grid)
-        basename = "ReverseAldousBroder"
-    elif algorithm in ['ABW', 'AldousBroderWilson']:
-        from wilson import Wilson as ABW
-        basename = "AldousBroderWilson"
-        if bias is None:
-            bias = 0.5
-        else:
-            basename += "-bias%f" % bias
-        ABW.hybrid_on(grid, cutoff=bias)
-    elif algorithm in ['BT', 'BinaryTree']:
-        from binary_tree import Binary_Tree
-        basename = "BinaryTree"
-        if bias is None:
-            bias = 0.5
-        else:
-            basename += "-bias%f" % bias
-        Binary_Tree.on(grid, bias=bias)
-    elif algorithm in ['BT2', 'BinaryTree2']:
-        from binary_tree2 import Binary_Tree
-        Binary_Tree.on(grid)
-        basename = "BinaryTree2"
-    elif algorithm in ['DFS', 'RBT', 'RecursiveBackTracker']:
-        from recursive_backtracker import Recursive_Backtracker
-        Recursive_Backtracker.on(grid)
-        basename = "RecursiveBacktracker"
-    elif algorithm in ['HK', 'HuntKill', 'HuntAndKill']:
-        from hunt_and_kill import Hunt_and_Kill
-        Hunt_and_Kill.on(grid)
-        basename = "HuntAndKill"
-    elif algorithm in ['NRDFS', 'Labyrinth']:
-        from recursive_backtracker import Recursive_Backtracker
-        Recursive_Backtracker.deterministic_on(grid)
-        basename = "Labyrinth"
-    elif algorithm in ['SW', 'Sidewinder']:
-        from sidewinder import Sidewinder
-        basename = "Sidewinder"
+def resolve_algorithm(algorithm, bias):
+    """find the maze generation routine for an algorithm string
+
+    Returns:
+        a pair (carve, basename), where carve takes a grid and carves a
+        maze on it, and basename is the base name for the output file
+    """
+    from functools import partial
+    from importlib import import_module
+
+    if algorithm not in algorithms:
+        return None, None
+    module, classname, method, keyword, basename = algorithms[algorithm]
+    carve = getattr(getattr(import_module(module), classname), method)
+    if keyword:
         if bias is None:
             bias = 0.5
         else:
             basename += "-bias%f" % bias
-        Sidewinder.on(grid, bias=bias)
-    elif algorithm in ['BFS', 'BreadthFirstSearch']:
-        from tree_search import Tree_Search
-        Tree_Search.bfs_on(grid)
-        basename = "BreadthFirstSearch"
-    elif algorithm in ['HEAP', 'HeapSearch']:
-        from tree_search import Tree_Search
-        Tree_Search.heap_on(grid)
-        basename = "HeapSearch"
-    elif algorithm in ['W', 'Wilson']:
-        from wilson import Wilson
-        Wilson.on(grid)
-        basename = "Wilson"
+        carve = partial(carve, **{keyword: bias})
+    return carve, basename
+
+def generate_maze(algorithm, grid, bias, resolved=None):
+    """generate a maze
+
+    Optional arguments:
+        resolved - the value of resolve_algorithm(algorithm, bias), if
+            it has already been computed
+    """
+    print("Algorithm = %s, bias = %s" % (algorithm, str(bias)))
+    carve, basename = resolved if resolved \
+        else resolve_algorithm(algorithm, bias)
+    if carve:
+        carve(grid)
     print("maze generation: complete!")
     return basename
 
@@ -134,6 +140,18 @@ def define_color(dist, maxdist):
     blue = green
     return (red, green, blue)
 
+def define_palette(maxdist):
+    """associate a color with each distance from 0 to maxdist
+
+    The colors are those given by define_color."""
+    denominator = maxdist + 1
+    palette = {}
+    for dist in range(denominator):
+        half = dist / denominator / 2
+        green = 1 - half
+        palette[dist] = (0.5 + half, green, green)
+    return palette
+
 def render_plot(m, n, algorithm, bias):
     """render the maze using matplotlib"""
     import matplotlib.pyplot as plt
@@ -143,6 +161,7 @@ def render_plot(m, n, algorithm, bias):
     fig, axs = plt.subplots(2, 3)
     x0, y0 = int(m/2), int(n/2)
     basename = algorithm
+    resolved = resolve_algorithm(algorithm, bias)
     for i in range(2):
         for j in range(3):
             grid = make_grid(m, n)
@@ -150,21 +169,17 @@ def render_plot(m, n, algorithm, bias):
             center = grid[x0, y0]
             assert center, "Undefined grid center cell"
 
-            basename = generate_maze(algorithm, grid, bias)
+            basename = generate_maze(algorithm, grid, bias, resolved)
             ax = axs[i, j]
-            layout = Color_Layout(grid, plt, figure=[fig, ax])
+            layout = Color_Layout(grid, plt, figure=[fig, ax], batch=True)
 
                 # We use the distance from a middle cell as the
                 # palette index
             norms = distances(center)
             furthest = norms.furthest_from_root()
             maxdist = norms[furthest]
-            for dist in range(maxdist + 1):
-                layout.set_palette_color(dist, define_color(dist, maxdist))
-            for cell in grid.each():
-                dist = norms[cell]
-                if dist is not None:
-                    layout.set_color(cell, dist)
+            layout.set_palette(define_palette(maxdist))
+            layout.set_colors(norms.metrics)    # reachable cells only
 
             ax.set(aspect=1)
             ax.axis('off')
@@ -175,7 +190,7 @@ def render_plot(m, n, algorithm, bias):
     plt.subplots_adjust(hspace=.001, wspace=.001)
     plt.gca().xaxis.set_major_locator(plt.NullLocator())
     plt.gca().yaxis.set_major_locator(plt.NullLocator())
-    fig.savefig(filename, bbox_inches='tight', pad_inched=0.0)
+    fig.savefig(filename, bbox_inches='tight', pad_inches=0.0)
 
 def main(args):
     """Generate a maze"""
@@ -192,6 +207,8 @@ def main(args):
 
 if __name__ == "__main__":
     import argparse
+    import matplotlib
+    matplotlib.use("Agg")                   # we only save to files
     parser = argparse.ArgumentParser( \
         formatter_class = argparse.RawDescriptionHelpFormatter,
         epilog=make_epilog())
@@ -18,6 +18,13 @@
 #
 # Maintenance History:
 #     21 May 2020 - Initial version
+#     16 Oct 2026 - Use a deque for the breadth-first search queue
+#       Track visited cells in a set
+#       Look up each heap priority once; don't share the priority table
+#         between calls
+#       Shuffle small neighborhoods with a single random draw
+#       Use tuples for heap entries
+#       Bind the queue, heap and random number methods to locals
 """
 tree_search.py - generate mazes using tree search algorithms
 Copyright ©2020 by Eric Conrad
@@ -76,17 +83,35 @@ Bugs:
     See discussion above.
 """
 import random
+from collections import deque
+from itertools import permutations
+from operator import itemgetter
+
+    # To shuffle a neighborhood of two to four cells, we pick one of its
+    # permutations with a single random draw.  (random.shuffle uses one
+    # draw for each cell after the first.)
+_SHUFFLERS = dict((k, tuple(itemgetter(*p) for p in permutations(range(k)))) \
+    for k in range(2, 5))
 
 class Tree_Search:
     """implementation of some tree search algorithms"""
 
+    @staticmethod
+    def visited_cells(grid):
+        """the set of cells which are incident to a passage"""
+        return set(cell for cell in grid.each() if cell.arcs)
+
     @classmethod
     def bfs_on(cls, grid, start=None, randomize=True):
         """carve a spanning tree maze using breadth-first search"""
                 # BFS:
                 #   Place the start cell at the end of the queue.
         cell = start if start else grid.choice()
-        queue = [cell]
+        queue = deque([cell])
+        visited = cls.visited_cells(grid)
+        visited.add(cell)
+        popleft, append = queue.popleft, queue.append
+        randrange, shuffle = random.randrange, random.shuffle
 
                 #   While the queue is not empty:
                 #     remove the cell in the front of the queue
@@ -95,54 +120,68 @@ class Tree_Search:
                 #       place the neighbor at the end of the queue
 
         while queue:
-            cell = queue.pop(0)   # service the front
+            cell = popleft()          # service the front
 
                 # visit the neighbors
             nbrs = cell.neighbors()
             if randomize:
-                random.shuffle(nbrs)
+                shufflers = _SHUFFLERS.get(len(nbrs))
+                if shufflers:
+                    nbrs = shufflers[randrange(len(shufflers))](nbrs)
+                else:
+                    shuffle(nbrs)
             for nbr in nbrs:
-                if nbr.passages():
-                    continue                  # already visited
-                if nbr is cell:
-                    continue                  # loop in grid
+                if nbr in visited:
+                    continue                  # already visited (or a loop)
                 cell.makePassage(nbr)
-                queue.append(nbr)             # enter the neighbor
+                visited.add(nbr)
+                append(nbr)                   # enter the neighbor
 
     @classmethod
-    def heap_on(cls, grid, start=None, priorities={}):
-        """carve a spanning tree maze using a heap"""
-        import heapq
-
+    def heap_on(cls, grid, start=None, priorities=None):
+        """carve a spanning tree maze using a heap
+
+        Optional named arguments:
+            start - the starting cell (default: a random cell)
+            priorities - a dictionary mapping cells to priorities.  Cells
+                without a priority are assigned a random priority when
+                they are first entered into the heap.  (Default: an
+                empty dictionary)
+        """
+        from heapq import heappush, heappop
+        from itertools import count
+
+        if priorities is None:
+            priorities = {}
+        rand = random.random
         pq = []
-        d = {}
-        d['count'] = 1
+        serial = count(1)                   # tiebreaker for equal priorities
 
         def enter(cell, nbr):
             """enter a cell into the priority queue"""
-            if nbr not in priorities:
-                priorities[nbr] = random.random()
-            priority = priorities[nbr]
-            entry = [priority, d['count'], cell, nbr]
-            d['count'] += 1
-            heapq.heappush(pq, entry)
+            priority = priorities.get(nbr)
+            if priority is None:
+                priority = priorities[nbr] = rand()
+            heappush(pq, (priority, next(serial), cell, nbr))
 
+        visited = cls.visited_cells(grid)
         cell = start if start else grid.choice()
         enter(None, cell)
 
         while pq:
-            _, _, cell, nbr = heapq.heappop(pq)
-            if nbr.passages():
+            _, _, cell, nbr = heappop(pq)
+            if nbr in visited:
                 continue                    # already visited
             if nbr is cell:
                 continue                    # we don't carve loops
 
             if cell:                        # not None
                 cell.makePassage(nbr)
+            visited.add(nbr)
             cell = nbr
 
             for nbr in cell.each_neighbor():
-                if not nbr.passages():
+                if nbr not in visited:
                     enter(cell, nbr)
 
 # END: tree_search.py
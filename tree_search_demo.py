@@ -20,6 +20,7 @@
 ##############################################################################
 # Maintenance History:
 #     21 May 2020 - Initial version
+#     16 Oct 2026 - Sum the arc counts in check_maze with sum()
 ##############################################################################
 """
 tree_search_demo.py - test the tree search algorithms implementation
@@ -90,9 +91,7 @@ def check_maze(grid):
     """
     m, n = grid.rows, grid.cols
     v = m * n                             # number of vertices
-    e = 0                                 # number of arcs (2e)
-    for cell in grid.each():
-        e += len(cell.arcs)                   # Euler counting
+    e = sum(len(cell.arcs) for cell in grid.each())   # Euler counting
     k, _ = Helper.find_components(grid)
         # note: e is twice the number of edges
     assert e + 2 == 2 * v and k == 1, \
@@ -20,6 +20,9 @@
 ##############################################################################
 # Maintenance History:
 #     30 Jul 2020 - Initial version
+#     16 Oct 2026 - Batch the walls and patches of each panel
+#       Render with the non-interactive Agg backend
+#       In render, change pad_inched to pad_inches
 ##############################################################################
 """
 straightify_demo.py - demonstrate the twister braiding algorithm
@@ -35,6 +38,8 @@ References:
         Book (978-1-68050-055-4).
 """
 
+import matplotlib
+matplotlib.use("Agg")                  # we only save to files
 import matplotlib.pyplot as plt
 from braiding import Braiding
 
@@ -120,26 +125,26 @@ def render(maze, filename, p=0.3, tweaker=tweak, turns=None):
     print("Plotting...")
     print("   column 0 - given maze...")
     ax = axs[0]
-    layout = Color_Layout(maze, plt, figure=[fig, ax])
+    layout = Color_Layout(maze, plt, figure=[fig, ax], batch=True)
     layout.draw_grid()
     print("   column 1 - first pass, bias p=%f..." % (p * 100))
     n, _, k, q = Braiding.twister(maze, bias = p, turns = turns)
     print("       %d dead ends, %d removed (q=%f)" % (n, k, q * 100))
     ax = axs[1]
-    layout = Color_Layout(maze, plt, figure=[fig, ax])
+    layout = Color_Layout(maze, plt, figure=[fig, ax], batch=True)
     layout.draw_grid()
     print("   column 2 - first pass, full twisting...")
     n, _, k, q = Braiding.twister(maze)
     print("       %d dead ends, %d removed (q=%f)" % (n, k, q * 100))
     ax = axs[2]
-    layout = Color_Layout(maze, plt, figure=[fig, ax])
+    layout = Color_Layout(maze, plt, figure=[fig, ax], batch=True)
     layout.draw_grid()
 
     print("Saved to " + filename)
     plt.subplots_adjust(hspace=.001, wspace=.001)
     plt.gca().xaxis.set_major_locator(plt.NullLocator())
     plt.gca().yaxis.set_major_locator(plt.NullLocator())
-    fig.savefig(filename, bbox_inches='tight', pad_inched=0.0)
+    fig.savefig(filename, bbox_inches='tight', pad_inches=0.0)
     # plt.show()
 
 if __name__ == "__main__":
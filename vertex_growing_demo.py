@@ -22,6 +22,7 @@
 ##############################################################################
 # Maintenance History:
 #     9 Aug 2020 - Initial version
+#     16 Oct 2026 - Set the cell colors in bulk
 ##############################################################################
 """
 vertex_growing_demo.py - demonstrate growing tree algorithms for
@@ -126,11 +127,10 @@ def render(mazes, filename, tweaker=tweak):
             maze = mazes[i][j]
             ax = axs[i][j]
             layout = Color_Layout(maze, plt, figure=[fig, ax])
-            layout.palette[0] = "yellow"
-            layout.palette[1] = "green"
-            for cell in maze.each():
-                layout.color[cell] = 1 if "underCell" in cell.kwargs \
-                    else 0
+            layout.set_palette({0: "yellow", 1: "green"})
+            colors = dict.fromkeys(maze.each(), 0)
+            colors.update(dict.fromkeys(maze.under_cells, 1))
+            layout.set_colors(colors)
             layout.draw_grid()
 
     print("Saved to " + filename)
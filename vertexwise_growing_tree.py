@@ -19,6 +19,20 @@
 #
 # Maintenance History:
 #     10 Aug 2020 - Initial version
+#     16 Oct 2026 - Use heapq instead of the thread-safe PriorityQueue
+#       Use a deque for the FIFO queue and remove a random queue entry
+#         without shifting the queue
+#       In minimize_total_cost, look up each cost at most once
+#       Pick a random restart cell without listing the unvisited cells
+#       Don't shuffle the neighbors when the costs are random
+#       Keep the frontier in a set; fill the unvisited table in one step
+#       Draw the random costs in a comprehension
+#       A cell leaves the unvisited table when it enters the frontier
+#       Look up FIFO and LIFO costs just once
+#       Break ties by reservoir sampling
+#       Bind the state's tables and methods to locals in the inner loops
+#       Use a stack or a FIFO queue for the LIFO and FIFO cost states
+#       Draw the random costs from the unvisited table
 """
 vertexwise_growing_tree.py - spanning tree algorithms based on Prim's
     algorithm
@@ -93,8 +107,10 @@ Bugs:
     (1) The implementation assumes that all grid edges are undirected.
 """
 
-from random import random, randint, choice, shuffle
-from queue import PriorityQueue
+from random import random, randint, randrange, shuffle
+from itertools import islice
+from heapq import heappush, heappop
+from collections import deque
 
 #   MISSING from Python3.6
 # from dataclasses import dataclass, field
@@ -132,19 +148,28 @@ class Vertex_Prims:
         
         Subclasses can be developed by changing costOf and totalCostTo,
         or push and pop.  Normally a change is needed to initialize.
+
+        If the order in which cells enter the frontier cannot affect
+        the maze (for example, if ties in cost are impossible), a
+        subclass can set shuffle_neighbors to False.
+
+        Each cell is in exactly one of unvisited, frontier and visited.
+        A cell leaves unvisited when it enters the frontier, so a single
+        membership test tells whether a neighbor is new.
         """
 
+        shuffle_neighbors = True        # randomize frontier entry order
+
         def __init__(self, grid):
             """constructor"""
             self.grid = grid
-            self.unvisited = {}
-            self.frontier = {}
+                # mark all vertices (cells) as unvisited
+                #   (a dictionary keeps the grid order so that random
+                #   restarts are reproducible)
+            self.unvisited = dict.fromkeys(grid.each(), 1)
+            self.frontier = set()
             self.visited = {}
-            self.pq = PriorityQueue()
-
-            for cell in grid.each():
-                    # mark all vertices (cells) as unvisited
-                self.unvisited[cell] = 1
+            self.pq = []                        # a heap of Queue_Nodes
             self.initialize()
 
         def initialize(self):
@@ -167,12 +192,15 @@ class Vertex_Prims:
             """
                 # look for edges on the frontier
             nbrs = v.neighbors()
-            shuffle(nbrs)
+            if self.shuffle_neighbors:
+                shuffle(nbrs)
+            unvisited, costOf, push = self.unvisited, self.costOf, self.push
+            enter = self.frontier.add
             for w in nbrs:
-                if w in self.unvisited and w not in self.frontier:
-                    cost = self.costOf(w)
-                    self.push(cost, w)
-                    self.frontier[w] = cost
+                if w in unvisited:
+                    del unvisited[w]
+                    push(costOf(w), w)
+                    enter(w)
 
         def merge(self, via, to):
             """check and add the edge to the spanning tree"""
@@ -181,8 +209,7 @@ class Vertex_Prims:
                 # add the edge to the spanning tree
                 #   then mark vertex v as visited
             via.makePassage(to)
-            del self.unvisited[to]
-            del self.frontier[to]
+            self.frontier.remove(to)
             self.visited[to] = self.totalCostTo(via, to, self.visited)
 
                 # look for edges on the frontier
@@ -190,34 +217,46 @@ class Vertex_Prims:
 
         def push(self, cost, w):
             """push a cell onto the priority queue"""
-            self.pq.put_nowait(Vertex_Prims.Queue_Node(cost, w))
+            heappush(self.pq, Vertex_Prims.Queue_Node(cost, w))
 
         def pop(self):
             """get an item from the priority queue"""
-            if self.pq.empty():
+            if not self.pq:
                 return None
-            node = self.pq.get_nowait()
-            return node.item
+            return heappop(self.pq).item
 
         def minimize_total_cost(self, to):
-            """find a via vertex which minimizes total cost"""
-            vias = []
+            """find a via vertex which minimizes total cost
+
+            Ties are broken uniformly at random by reservoir sampling:
+            the k-th cell to tie for the least cost replaces the current
+            choice with probability 1/k.
+            """
             via = None
+            least = None                # the cost of via, once needed
+            ties = 0                    # number of cells tied with via
+            visited, costOf = self.visited, self.costOf
             for nbr in to.each_neighbor():
-                if nbr not in self.visited:
+                if nbr not in visited:
                     continue
-                if not via:
+                if via is None:
                     via = nbr
-                    vias = [nbr]
+                    ties = 1
                     continue
-                if self.costOf(via) < self.costOf(nbr):
+                if least is None:
+                    least = costOf(via)
+                cost = costOf(nbr)
+                if least < cost:
                     continue
-                if self.costOf(via) > self.costOf(nbr):
+                if least > cost:
                     via = nbr
-                    vias = [nbr]
+                    least = cost
+                    ties = 1
                     continue
-                vias.append(nbr)
-            return choice(vias)
+                ties += 1
+                if not randrange(ties):
+                    via = nbr
+            return via
 
     @classmethod
     def on(cls, grid, start=None, state=None, loop=True, debug=False):
@@ -227,15 +266,16 @@ class Vertex_Prims:
         if not state:
             state = cls.State(grid)
 
+        size = len(grid) if debug else None
         while state.unvisited:
             if debug:
                 print("Vertex_Prims: %d unvisited out of %d cells" \
-                    % (len(state.unvisited), len(grid)))
+                    % (len(state.unvisited), size))
 
                 # get a starting cell
             if start not in state.unvisited:
-                cells = list(state.unvisited.keys())
-                start = choice(cells)
+                index = randrange(len(state.unvisited))
+                start = next(islice(state.unvisited, index, None))
 
                 # adjust visited, unvisited, frontier and priority queue
             state.visited[start] = 0
@@ -257,11 +297,16 @@ class Vertex_Prims:
 class Random_Cost_State(Vertex_Prims.State):
     """random vertex cost"""
 
+    shuffle_neighbors = False           # the costs are already random
+
     def initialize(self):
-        """initialize the costs"""
-        self.costs = {}
-        for cell in self.grid.each():
-            self.costs[cell] = random()
+        """initialize the costs
+
+        Every cell is still unvisited here, so the unvisited table
+        supplies the cells in grid order without another pass over
+        the grid.
+        """
+        self.costs = {cell: random() for cell in self.unvisited}
 
     def costOf(self, cell):
         """the cost of a cell when placed in the frontier"""
@@ -277,25 +322,54 @@ class LIFO_Cost_State(Vertex_Prims.State):
 
     def costOf(self, cell):
         """the cost of a cell when placed in the frontier"""
-        if cell not in self.costs:
-            self.costs[cell] = self.base_cost
+        cost = self.costs.get(cell)
+        if cost is None:
+            cost = self.costs[cell] = self.base_cost
             self.base_cost -= 1       # next one will be cheaper
-        return self.costs[cell]
+        return cost
+
+    def push(self, cost, v):
+        """push a vertex onto the priority queue
+
+        Cells are priced as they are pushed and each is cheaper than the
+        last, so the least cost cell is the most recent one: a stack
+        serves as the priority queue.
+        """
+        self.pq.append(v)
+
+    def pop(self):
+        """get the least cost vertex from the priority queue"""
+        return self.pq.pop()
 
 class FIFO_Cost_State(Vertex_Prims.State):
     """oldest in frontier are least cost"""
 
     def initialize(self):
-        """initialize the costs"""
+        """initialize the costs and the queue"""
         self.base_cost = 1
         self.costs = {}
+        self.pq = deque()
 
     def costOf(self, cell):
         """the cost of a cell when placed in the frontier"""
-        if cell not in self.costs:
-            self.costs[cell] = self.base_cost
+        cost = self.costs.get(cell)
+        if cost is None:
+            cost = self.costs[cell] = self.base_cost
             self.base_cost += 1       # next one will be pricier
-        return self.costs[cell]
+        return cost
+
+    def push(self, cost, v):
+        """push a vertex onto the priority queue
+
+        Cells are priced as they are pushed and each is pricier than the
+        last, so the least cost cell is the oldest one: a FIFO queue
+        serves as the priority queue.
+        """
+        self.pq.append(v)
+
+    def pop(self):
+        """get the least cost vertex from the priority queue"""
+        return self.pq.popleft()
 
     # we can instead work with push and pop to change the queue
     # discipline...
@@ -318,16 +392,22 @@ class LIFO_Queue_State(Vertex_Prims.State):
 class FIFO_Queue_State(LIFO_Queue_State):
     """replacing the priority queue with a FIFO queue"""
 
+    def initialize(self):
+        """initialize the queue"""
+        self.pq = deque()
+
     def pop(self):
-        """remove a vertex from the stack"""
-        return self.pq.pop(0)
+        """remove a vertex from the queue"""
+        return self.pq.popleft()
 
 class RIFO_Queue_State(LIFO_Queue_State):
     """replacing the priority queue with a random queue"""
 
     def pop(self):
         """remove a vertex from the stack"""
-        index = randint(0, len(self.pq)-1)
-        return self.pq.pop(index)
+        pq = self.pq
+        index = randint(0, len(pq)-1)
+        pq[index], pq[-1] = pq[-1], pq[index]   # no shift needed
+        return pq.pop()
 
 # END: vertexwise_growing_tree.py
@@ -19,6 +19,12 @@
 # Maintenance History:
 #     29 Jul 2020 - Initial version
 #     1 Aug 2020 - Add Simple_Overcell
+#     16 Oct 2026 - Overcell neighborhoods are not static
+#       Traverse the neighborhood without reindexing the topology
+#       Look for tunnels in a single pass
+#       Test for through passages against the arcs directly
+#       Read the topology directly when checking tunnels
+#       Declare __slots__
 """
 weave_cell.py - cell implementation for rectangular weave mazes
 Copyright ©2020 by Eric Conrad
@@ -69,9 +75,19 @@ Bugs:
 
 from square_cell import Square_Cell
 
+    # the directions in which an overcell can tunnel, in the order that
+    # the tunnels are visited, each with a flag that is True if the
+    # tunnel passes under a horizontal passage
+_TUNNELS = (("south", True), ("east", False), ("north", True),
+    ("west", False))
+
 class Overcell(Square_Cell):
     """ground level cell implementation for rectangular weave mazes"""
 
+    __slots__ = ("grid",)
+
+    static_neighborhood = False   # tunnels open up as passages are carved
+
     def __init__(self, row, col, grid, **kwargs):
         """constructor
 
@@ -94,91 +110,93 @@ class Overcell(Square_Cell):
     def neighbors(self):
         """return a list of neighboring cells"""
         L = super().neighbors()
-        if self.can_tunnel_south():
-            L.append(self["south"]["south"])
-        if self.can_tunnel_east():
-            L.append(self["east"]["east"])
-        if self.can_tunnel_north():
-            L.append(self["north"]["north"])
-        if self.can_tunnel_west():
-            L.append(self["west"]["west"])
+        L.extend(self.each_tunnel())
         return L
 
     def each_neighbor(self):
-        for direction in self.topology:
-            nbr = self.topology[direction]
+        for nbr in self.topology.values():
             if nbr:
                 yield nbr
-        if self.can_tunnel_south():
-            yield self["south"]["south"]
-        if self.can_tunnel_east():
-            yield self["east"]["east"]
-        if self.can_tunnel_north():
-            yield self["north"]["north"]
-        if self.can_tunnel_west():
-            yield self["west"]["west"]
+        yield from self.each_tunnel()
+
+    def each_tunnel(self):
+        """traverse the cells which can be reached by tunneling
+
+        This is equivalent to checking can_tunnel_south, can_tunnel_east,
+        can_tunnel_north and can_tunnel_west in turn, but each topology
+        entry is read just once.
+        """
+        topology = self.topology
+        for direction, horizontal in _TUNNELS:
+            nbr = topology.get(direction)
+            if not nbr:
+                continue
+            beyond = nbr.topology.get(direction)
+            if not beyond:
+                continue
+            if nbr.is_horizontal_thru() if horizontal \
+                    else nbr.is_vertical_thru():
+                yield beyond
 
     def can_tunnel_south(self):
         """check tunneling"""
-        south = self["south"]
+        south = self.topology.get("south")
                 # is there a southern neighbor?
         if not south:
             return False
                 # does this neighbor have a neighbor to the south?
-        if not south["south"]:
+        if not south.topology.get("south"):
             return False
                 # is there a horizontal passage to tunnel under?
         return south.is_horizontal_thru()
 
     def can_tunnel_north(self):
         """check tunneling"""
-        north = self["north"]
+        north = self.topology.get("north")
                 # is there a northern neighbor?
         if not north:
             return False
                 # does this neighbor have a neighbor to the north?
-        if not north["north"]:
+        if not north.topology.get("north"):
             return False
                 # is there a horizontal passage to tunnel under?
         return north.is_horizontal_thru()
 
     def can_tunnel_east(self):
         """check tunneling"""
-        east = self["east"]
+        east = self.topology.get("east")
                 # is there an eastern neighbor?
         if not east:
             return False
                 # does this neighbor have a neighbor to the east?
-        if not east["east"]:
+        if not east.topology.get("east"):
             return False
                 # is there a vertical passage to tunnel under?
         return east.is_vertical_thru()
 
     def can_tunnel_west(self):
         """check tunneling"""
-        west = self["west"]
+        west = self.topology.get("west")
                 # is there an eastern neighbor?
         if not west:
             return False
                 # does this neighbor have a neighbor to the west?
-        if not west["west"]:
+        if not west.topology.get("west"):
             return False
                 # is there a horizontal passage to tunnel under?
         return west.is_vertical_thru()
 
     def is_vertical_thru(self):
         """do we have a vertical 3-passage?"""
-        return self.have_passage(self["north"]) \
-            and self.have_passage(self["south"]) \
-            and not self.have_passage(self["east"]) \
-            and not self.have_passage(self["west"])
+        arcs, nbr = self.arcs, self.topology.get
+        return nbr("north") in arcs and nbr("south") in arcs \
+            and nbr("east") not in arcs and nbr("west") not in arcs
 
     def is_horizontal_thru(self):
         """do we have a horizontal 3-passage?"""
-        return self.have_passage(self["east"]) \
-            and self.have_passage(self["west"]) \
-            and not self.have_passage(self["north"]) \
-            and not self.have_passage(self["south"])
+        arcs, nbr = self.arcs, self.topology.get
+        return nbr("east") in arcs and nbr("west") in arcs \
+            and nbr("north") not in arcs and nbr("south") not in arcs
 
     def makePassage(self, nbr, twoWay=True):
         """establish a passage to a given cell"""
@@ -206,24 +224,24 @@ class Overcell(Square_Cell):
 class Simple_Overcell(Overcell):
     """for preconfigured weaving with Kruskal's algorithm"""
 
+    __slots__ = ()
+
+    static_neighborhood = True    # the weave is preconfigured
+
     def neighbors(self):
         """return a list of neighboring cells"""
-        L = []
-        for direction in self.topology:
-            nbr = self.topology[direction]
-            if nbr:
-                L.append(nbr)
-        return L
+        return [nbr for nbr in self.topology.values() if nbr]
 
     def each_neighbor(self):
-        for direction in self.topology:
-            nbr = self.topology[direction]
+        for nbr in self.topology.values():
             if nbr:
                 yield nbr
 
 class Undercell(Square_Cell):
     """underground cell implementation for rectangular weave mazes"""
 
+    __slots__ = ()
+
     def __init__(self, parent, **kwargs):
         """constructor
 
@@ -282,6 +300,8 @@ class Undercell(Square_Cell):
 class Simple_Undercell(Undercell):
     """underground cell implementation for rectangular weave mazes"""
 
+    __slots__ = ()
+
     def configure_undercell(self, parent):
         """topology adjustments happen elsewhere"""
         pass
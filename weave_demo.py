@@ -20,6 +20,9 @@
 ##############################################################################
 # Maintenance History:
 #     29 Jul 2020 - Initial version
+#     16 Oct 2026 - Batch the plots and set the cell colors in bulk
+#       Close the figure after saving it
+#       Count the undercells using Weave_Grid.under_cells
 ##############################################################################
 """
 weave_demo.py - demonstrate rectangular weave mazes
@@ -56,10 +59,7 @@ def generate_maze(grid, algorithm):
 
     print("Generate perfect maze using %s" % algorithm.__name__)
     algorithm.on(grid)
-    n = 0
-    for cell in grid.each():
-        if "underCell" in cell.kwargs:
-            n += 1
+    n = len(grid.under_cells)           # grid is a weave grid
     m = grid.rows * grid.cols
     print("Number of cells = %d, including %d undercells" % (m, n))
     print("Done!")
@@ -103,19 +103,20 @@ def render(mazes, filename, tweaker=tweak, titles=titles3):
         print("   plotting maze %d..." % (j+1))
         maze = mazes[j]
         ax = axs[j]
-        layout = Color_Layout(maze, plt, figure=[fig, ax])
-        layout.palette[0] = "yellow"
-        layout.palette[1] = "green"
-        for cell in maze.each():
-            layout.color[cell] = 1 if "underCell" in cell.kwargs else 0
+        layout = Color_Layout(maze, plt, figure=[fig, ax], batch=True)
+        layout.set_palette({0: "yellow", 1: "green"})
+        colors = dict.fromkeys(maze.each(), 0)
+        colors.update(dict.fromkeys(maze.under_cells, 1))
+        layout.set_colors(colors)
         layout.draw_grid()
 
     print("Saved to " + filename)
     plt.subplots_adjust(hspace=.001, wspace=.001)
     plt.gca().xaxis.set_major_locator(plt.NullLocator())
     plt.gca().yaxis.set_major_locator(plt.NullLocator())
-    fig.savefig(filename, bbox_inches='tight', pad_inched=0.0)
+    fig.savefig(filename, bbox_inches='tight', pad_inches=0.0)
     # plt.show()
+    plt.close(fig)                      # release the figure once saved
 
 if __name__ == "__main__":
     print("Weave Maze Test Script...")
@@ -20,6 +20,12 @@
 #     29 Jul 2020 - Initial version
 #     1 Aug 2020 - Corrected handling of default inset
 #     2 Aug 2020 - Added long_tunnel method to Preweave class
+#     16 Oct 2026 - Keep track of the undercells
+#       Stop the long tunnel feasibility walk at the first missing cell
+#       Test for isolated cells with a set comparison
+#       Compute the cell x-coordinates once per grid
+#       Read the topology entries directly when building long tunnels
+#       Default the inset with setdefault
 """
 weave_grid.py - rectangular weave grid and maze implementation
 Copyright ©2020 by Eric Conrad
@@ -68,21 +74,27 @@ class Weave_Grid(Rectangular_Grid):
             wallAdder - if present (ignoring value), will add passages
         """
             # grid management
-        if "inset" not in kwargs:               # 1 Aug 2020
-            kwargs["inset"] = 0.15
+        kwargs.setdefault("inset", 0.15)        # 1 Aug 2020
+        self.under_cells = set()                # 16 Oct 2026
 
         super().__init__(rows, cols, **kwargs)
 
+    def __delitem__(self, index):
+        """remove the cell with the given index"""
+        self.under_cells.discard(self.cells[index])
+        super().__delitem__(index)
+
     def initialize(self):
         """grid initialization, e.g. create cells
         
         Apart from the cell constructor call, this code should be
         identical with the code in Rectangular_Grid.initialize()"""
         h, k = self.origin
+        xs = [self.scale * j + h for j in range(self.cols)]
         for i in range(self.rows):
+            y = self.scale * i + k
             for j in range(self.cols):
-                x = self.scale * j + h
-                y = self.scale * i + k
+                x = xs[j]
                 name = "C[%d,%d]" % (i, j)      # added 30 Apr 2020
                     # the following line should be the only change!
                 cell = Overcell(i, j, self, position=(x, y), \
@@ -93,6 +105,7 @@ class Weave_Grid(Rectangular_Grid):
         undercell = Undercell(overcell)
         i, j = overcell.index
         self[i, j, 1] = undercell
+        self.under_cells.add(undercell)
 
 class Preweave_Grid(Weave_Grid):
     """rectangular weave grid with preconfigured weave"""
@@ -103,10 +116,11 @@ class Preweave_Grid(Weave_Grid):
         Apart from the cell constructor call, this code should be
         identical with the code in Weave_Grid.initialize()"""
         h, k = self.origin
+        xs = [self.scale * j + h for j in range(self.cols)]
         for i in range(self.rows):
+            y = self.scale * i + k
             for j in range(self.cols):
-                x = self.scale * j + h
-                y = self.scale * i + k
+                x = xs[j]
                 name = "C[%d,%d]" % (i, j)      # added 30 Apr 2020
                     # the following line should be the only change!
                 cell = Simple_Overcell(i, j, self, position=(x, y), \
@@ -136,12 +150,13 @@ class Preweave_Grid(Weave_Grid):
             # Step 1 - walk in the tunnel direction...
         s = "Step 1 - not enough cells %s of start" % direction
         L = []        # the cells that the tunnel will go under
-        last = start[direction]
+        last = start
         for i in range(length):
-            L.append(last)
+            last = last[direction]
             if not last:
                 return s, [], None
-            last = last[direction]
+            L.append(last)
+        last = last[direction]
         if not last:
             return s, [], None
             #   At this point we have the needed cells.
@@ -157,10 +172,7 @@ class Preweave_Grid(Weave_Grid):
             # Step 3 - check that tunnel construction does not isolate
             #   any cell
         def would_isolate_if(cell, tunnel_nbrs):
-            for nbr in cell.neighbors():
-                if nbr not in tunnel_nbrs:
-                    return False
-            return True
+            return tunnel_nbrs.issuperset(cell.neighbors())
 
         s = "Step 3 - the tunnel would isolate a cell"
         if would_isolate_if(start, {start[direction]}):
@@ -190,6 +202,7 @@ class Preweave_Grid(Weave_Grid):
             undercell = Simple_Undercell(cell)
             row, col = cell.index
             self[row, col, 1] = undercell
+            self.under_cells.add(undercell)
             L.append(undercell)
 
             # connect the tunnel
@@ -200,20 +213,20 @@ class Preweave_Grid(Weave_Grid):
             cell.makePassage(nbr)
 
             # correct the grid topology
-        for direction in first.topology:
-            if first[direction] is interior[0]:
+        for direction, nbr in first.topology.items():
+            if nbr is interior[0]:
                 first[direction] = L[0]
-        for direction in last.topology:
-            if last[direction] is interior[-1]:
+        for direction, nbr in last.topology.items():
+            if nbr is interior[-1]:
                 last[direction] = L[-1]
         for i in range(length):
             overcell = interior[i]
             undercell = L[i]
             adjustments = []
-            for direction in overcell.topology:
-                if overcell[direction] is path[i]:
+            for direction, nbr in overcell.topology.items():
+                if nbr is path[i]:
                     adjustments.append([direction, i])
-                if overcell[direction] is path[i+2]:
+                if nbr is path[i+2]:
                     adjustments.append([direction, i+2])
             for direction, j in adjustments:
                 del overcell.topology[direction]
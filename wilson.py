@@ -18,6 +18,12 @@
 #
 # Maintenance History:
 #     10 May 2020 - Initial version
+#     16 Oct 2026 - Index the path to find circuits without a list search
+#       Keep the unvisited cells in a constant time collection
+#       Cache static neighborhoods
+#       Test for visits in the hybrid against the unvisited cells
+#       Add an optional source of random numbers
+#       Erase circuits in place without returning the path
 """
 wilson.py - Wilson's algorithm
 Copyright ©2020 by Eric Conrad
@@ -90,31 +96,89 @@ Bugs:
 class Wilson:
     """implementation of Wilson's algorithm and a hybrid algorithm"""
 
+    class Unvisited(object):
+        """the unvisited cells
+
+        The cells are kept in a list so that one can be chosen at random,
+        and a dictionary maps each cell to its position in the list.
+        Membership tests, removals and random choices all take constant
+        time.  A cell is removed by moving the last cell into its place,
+        so the order of the list is not preserved.
+        """
+
+        def __init__(self, cells):
+            """constructor"""
+            self.cells = list(cells)
+            self.where = {cell: i for i, cell in enumerate(self.cells)}
+
+        def __len__(self):
+            """the number of unvisited cells"""
+            return len(self.cells)
+
+        def __getitem__(self, i):
+            """index into the list (for random.choice)"""
+            return self.cells[i]
+
+        def __contains__(self, cell):
+            """is the cell unvisited?"""
+            return cell in self.where
+
+        def remove(self, cell):
+            """mark a cell as visited"""
+            i = self.where.pop(cell)
+            last = self.cells.pop()
+            if last is not cell:
+                self.cells[i] = last
+                self.where[last] = i
+
     @staticmethod
     def populate(grid):
-        """create a list of unvisited cells"""
-        unvisited = []
-        for cell in grid.each():
-            unvisited.append(cell)
-        return unvisited
+        """create the collection of unvisited cells"""
+        return Wilson.Unvisited(grid.each())
 
     @staticmethod
-    def circuit_erased_path(path, nbr):
+    def circuit_erased_path(path, position, nbr):
         """extend simple path with circuit erasure
 
         Arguments:
             path - a simple path (list of cells)
+            position - a dictionary mapping each cell in the path to
+                its index in the path
             nbr - an element to add to path (cell)
 
+        Side effects:
+            The path and the position dictionary are updated
+
         Returns:
-            the updated path
+            Nothing
         """
-        path.append(nbr)        # add the cell to the simple path
-        n = path.index(nbr) + 1
-        if n < len(path):
+        n = position.get(nbr)
+        if n is None:
+            position[nbr] = len(path)
+            path.append(nbr)        # add the cell to the simple path
+        else:
                 # we have a simple circuit in the tail of the walk
-            path = path[:n]         # erase the circuit
-        return path
+            for cell in path[n+1:]:
+                del position[cell]
+            del path[n+1:]          # erase the circuit
+
+    @staticmethod
+    def neighborhood(cell, neighborhoods):
+        """the list of neighbors of a cell
+
+        Arguments:
+            cell - the cell
+            neighborhoods - a dictionary of cached neighborhoods
+
+        Side effects:
+            The neighborhood is cached if it is static
+        """
+        nbrs = neighborhoods.get(cell)
+        if nbrs is None:
+            nbrs = cell.neighbors()
+            if cell.static_neighborhood:
+                neighborhoods[cell] = nbrs
+        return nbrs
 
     @staticmethod
     def carve_path(grid, path, unvisited):
@@ -124,7 +188,7 @@ class Wilson:
             grid - the maze to update
             path - the path to carve (the last cell is the only
                    visited cell)
-            unvisited - the unvisited part of the grid (list)
+            unvisited - the unvisited part of the grid (Unvisited)
 
         Side effects:
             The grid and the list of unvisited cells are updated
@@ -139,7 +203,7 @@ class Wilson:
             cell.makePassage(nbr)         # side effect - grid
 
     @classmethod
-    def on(cls, grid, start=None):
+    def on(cls, grid, start=None, rng=None):
         """carve a spanning tree maze using Wilson's algorithm
 
         Preconditions:
@@ -149,29 +213,35 @@ class Wilson:
             grid - a grid
             start - a starting cell - if none is specified, we choose
                 a cell at random
+            rng (default is the random module) - a source of random
+                numbers, e.g. random.Random(seed) for a reproducible maze
         """
-        import random
+        if not rng:
+            import random as rng
+        choice = rng.choice
 
                 # preparation
         unvisited = cls.populate(grid)
-        cell = start if start else grid.choice()
+        cell = start if start else choice(unvisited)
         unvisited.remove(cell)
+        neighborhoods = {}                # cache of static neighborhoods
 
         while unvisited:
                     # start somewhere in the mists
-            cell = random.choice(unvisited)
+            cell = choice(unvisited)
             path = [cell]
+            position = {cell: 0}
             while cell in unvisited:
                         # random walk
-                nbr = random.choice(list(cell.neighbors()))
-                path = cls.circuit_erased_path(path, nbr)
+                nbr = choice(cls.neighborhood(cell, neighborhoods))
+                cls.circuit_erased_path(path, position, nbr)
                 cell = nbr            # continue
  
                     # carve the path and update unvisited
             cls.carve_path(grid, path, unvisited)
 
     @classmethod
-    def hybrid_on(cls, grid, start=None, cutoff=0.5):
+    def hybrid_on(cls, grid, start=None, cutoff=0.5, rng=None):
         """carve a spanning tree maze using a hybrid algorithm
 
         Preconditions:
@@ -183,26 +253,31 @@ class Wilson:
                 a cell at random
             cutoff - the proportion of cell to process using Aldous/Broder;
                 the remainder will be processed using Wilson.
+            rng (default is the random module) - a source of random
+                numbers, e.g. random.Random(seed) for a reproducible maze
 
         Note:
             if cutoff is greater than or equal to 1, the result is just
             Wilson's algorithm.  If cutoff is less than or equal to 0,
             the result is the first-entrance Aldous/Broder algorithm.
         """
-        import random
+        if not rng:
+            import random as rng
+        choice = rng.choice
 
                 # preparation
         unvisited = cls.populate(grid)
-        cell = start if start else grid.choice()
+        cell = start if start else choice(unvisited)
         unvisited.remove(cell)
+        neighborhoods = {}                # cache of static neighborhoods
         cutoff_count = int(len(grid) * cutoff) if cutoff > 0 else 0
 
                 # Aldous/Broder (first entrance random walk)
         while len(unvisited) > cutoff_count:
                     # go somewhere
-            nbr = random.choice(list(cell.neighbors()))
+            nbr = choice(cls.neighborhood(cell, neighborhoods))
 
-            if not nbr.arcs:              # not yet visited
+            if nbr in unvisited:          # not yet visited
                 unvisited.remove(nbr)
                 cell.makePassage(nbr)
 
@@ -211,12 +286,13 @@ class Wilson:
                 # Wilon (circuit-erased random walk)
         while unvisited:
                     # start somewhere in the mists
-            cell = random.choice(unvisited)
+            cell = choice(unvisited)
             path = [cell]
+            position = {cell: 0}
             while cell in unvisited:
                         # random walk
-                nbr = random.choice(list(cell.neighbors()))
-                path = cls.circuit_erased_path(path, nbr)
+                nbr = choice(cls.neighborhood(cell, neighborhoods))
+                cls.circuit_erased_path(path, position, nbr)
                 cell = nbr            # continue
  
                     # carve the path and update unvisited